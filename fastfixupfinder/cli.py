@@ -1,16 +1,23 @@
 """Command-line interface for Fast Fixup Finder."""
 
+import functools
+import io
 import sys
 from pathlib import Path
 import re
+import textwrap
+import time
 
 import click
-from tabulate import tabulate
 
-from .fixup_creator import FixupCreator, Colors
-from .git_analyzer import FilterMode
+from .colors import Colors
+from .tables import format_simple_table
 
 
+_VERSION_RE = re.compile(r'version\s*=\s*"([^"]+)"')
+
+
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
     """Get version from package metadata or pyproject.toml."""
     # Try importlib.metadata first (standard Python way)
@@ -23,17 +30,82 @@ def get_version() -> str:
     # Fallback to reading pyproject.toml for development installs
     try:
         pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
-        with open(pyproject_path, "r") as f:
-            content = f.read()
-            match = re.search(r'version\s*=\s*"([^"]+)"', content)
-            if match:
-                return match.group(1)
+        match = _VERSION_RE.search(pyproject_path.read_text())
+        if match:
+            return match.group(1)
     except Exception:
         pass
 
     return "unknown"
 
 
+# FilterMode values keyed by (--fixups-only, --include-all); both flags together is an error
+_FILTER_MODE_BY_FLAGS = {
+    (False, False): "smart_default",
+    (True, False): "fixups_only",
+    (False, True): "include_all",
+}
+
+# Minimum seconds between progress line redraws
+_PROGRESS_INTERVAL = 0.05
+
+# Buffered output larger than this (in characters) goes through a pager on a terminal
+_PAGER_THRESHOLD = 1024 * 1024
+
+# Column headers for the compact one-line target table
+_ONELINE_HEADERS = (
+    Colors.colorize("Hash", Colors.BRIGHT_CYAN, bold=True),
+    Colors.colorize("Commit Message", Colors.WHITE, bold=True),
+    Colors.colorize("Files", Colors.BRIGHT_BLUE, bold=True),
+    Colors.colorize("Lines", Colors.BRIGHT_YELLOW, bold=True),
+)
+
+_ONELINE_RIGHT_ALIGNED = (False, False, True, True)
+_ONELINE_MAX_MESSAGE_LEN = 55
+
+# Change-type markers for the detailed status listing (modified is the fallback)
+_SYM_ADD = Colors.colorize("+ ", Colors.BRIGHT_GREEN, bold=True)
+_SYM_DEL = Colors.colorize("- ", Colors.BRIGHT_RED, bold=True)
+_SYM_MOD = Colors.colorize("~ ", Colors.BRIGHT_YELLOW, bold=True)
+_CHANGE_SYMBOLS = {'added': _SYM_ADD, 'deleted': _SYM_DEL}
+
+
+def _render_oneline_table(targets) -> str:
+    """Render fixup targets as a compact table with one row per target."""
+    colorize = Colors.colorize
+    colored_data = []
+    for target in targets:
+        # Collapse newlines and extra whitespace, then truncate for table display
+        message = target.one_line_message
+        message = message[:_ONELINE_MAX_MESSAGE_LEN-3] + "..." if len(message) > _ONELINE_MAX_MESSAGE_LEN else message
+
+        colored_data.append((
+            colorize(target.short_hash, Colors.BRIGHT_CYAN, bold=True),  # hash
+            message,  # message (no color for readability)
+            colorize(str(len(target.files)), Colors.BRIGHT_BLUE),  # files
+            colorize(str(len(target.changed_lines)), Colors.BRIGHT_YELLOW),  # lines
+        ))
+
+    return format_simple_table(colored_data, _ONELINE_HEADERS, _ONELINE_RIGHT_ALIGNED)
+
+
+def _write_output(text: str) -> None:
+    """Write a large block of output with a single flush, paging it on a terminal if huge."""
+    if len(text) > _PAGER_THRESHOLD and sys.stdout.isatty():
+        click.echo_via_pager(text)
+    else:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def _format_filter_info(org_email: str, limit) -> str:
+    """Build the filter settings banner shown before analysis."""
+    filter_info = f"📧 Filtering by org email: {org_email}"
+    if limit:
+        filter_info += f" | 📍 Limit: {limit[:8]}..."
+    return filter_info
+
+
 @click.group()
 @click.version_option(version=get_version())
 def main():
@@ -56,209 +128,108 @@ if __name__ == '__main__':
 @click.option('--limit', type=str, help='Limit search to commits after this SHA1 (commit hash)')
 def status(repo, oneline, detailed, fixups_only, include_all, org_email, limit):
     """Show current fixup targets without making any changes."""
+    # Deferred so --help/--version don't load git machinery
+    from .fixup_creator import FixupCreator
+    from .git_analyzer import FilterMode, compile_org_email_pattern
+
     try:
         # Determine filter mode from flags
-        if fixups_only and include_all:
+        mode_flags = (fixups_only, include_all)
+        if mode_flags not in _FILTER_MODE_BY_FLAGS:
             click.echo(Colors.colorize("❌ Error: Cannot use both --fixups-only and --include-all", Colors.BRIGHT_RED), err=True)
             sys.exit(1)
-        elif fixups_only:
-            filter_mode = FilterMode.FIXUPS_ONLY
-        elif include_all:
-            filter_mode = FilterMode.INCLUDE_ALL
-        else:
-            filter_mode = FilterMode.SMART_DEFAULT
+        filter_mode = FilterMode(_FILTER_MODE_BY_FLAGS[mode_flags])
         
-        creator = FixupCreator(repo, org_email_pattern=org_email)
+        org_email_regex = compile_org_email_pattern(org_email)
+        creator = FixupCreator(repo, org_email_pattern=org_email_regex)
 
         # Display filter settings
         if not oneline:
-            filter_info = f"📧 Filtering by org email: {org_email}"
-            if limit:
-                filter_info += f" | 📍 Limit: {limit[:8]}..."
-            click.echo(Colors.colorize(filter_info, Colors.DIM))
+            click.echo(Colors.colorize(_format_filter_info(org_email, limit), Colors.DIM))
+
+        # Create progress callback for non-oneline mode, throttled to ~20 redraws per second
+        last_progress = [0.0]
 
-        # Create progress callback for non-oneline mode
         def progress_callback(message):
+            now = time.monotonic()
+            if now - last_progress[0] < _PROGRESS_INTERVAL:
+                return
+            last_progress[0] = now
             if not oneline:
                 click.echo(f"\r{Colors.colorize(message, Colors.CYAN)}" + " " * 10, nl=False)
 
         # Get all targets
-        all_targets = creator.analyzer.find_fixup_targets(filter_mode, progress_callback if not oneline else None, limit_sha=limit)
-
-        # Apply organization filtering
-        targets = creator.analyzer.filter_targets_by_organization(all_targets, org_email)
+        # Get targets, filtered by organization email inside the analyzer
+        targets = creator.analyzer.find_fixup_targets(filter_mode, progress_callback if not oneline else None, limit_sha=limit,
+                                                      filter_author_email=org_email_regex)
 
         # Clear progress indicator
         if not oneline:
             click.echo("\r" + " " * 50 + "\r", nl=False)  # Clear the progress line
 
         if not targets:
-            if oneline:
-                click.echo(Colors.colorize("No fixup targets found.", Colors.YELLOW))
-            else:
-                click.echo(Colors.colorize("🔍 No fixup targets found.", Colors.YELLOW))
-                click.echo(Colors.colorize("   Working directory is clean or no blame information available.", Colors.DIM))
+            creator._report_no_targets(oneline)
             return
         
         if detailed:
             # Detailed analysis (former analyze command)
+            count_text = Colors.colorize(str(len(targets)), Colors.BRIGHT_GREEN, bold=True)
             if oneline:
-                # Simple header for oneline mode
-                count_text = Colors.colorize(str(len(targets)), Colors.BRIGHT_GREEN, bold=True)
-                click.echo(f"Found {count_text} fixup targets:")
+                # Simple header for oneline mode, written together with the table
+                click.echo(f"Found {count_text} fixup targets:\n{_render_oneline_table(targets)}")
             else:
                 # Header with emoji and color
-                count_text = Colors.colorize(str(len(targets)), Colors.BRIGHT_GREEN, bold=True)
                 header = f"🔬 Detailed analysis of {count_text} fixup target{'s' if len(targets) != 1 else ''}:"
-                click.echo(Colors.colorize(header, Colors.WHITE, bold=True))
-                click.echo()
-            
-            if oneline:
-                # Create table data for compact format
-                table_data = []
-                for target in targets:
-                    short_hash = target.commit_hash[:8]
-                    
-                    # Truncate message for table display and clean up
-                    # Remove newlines and extra whitespace
-                    clean_message = ' '.join(target.commit_message.split())
-                    max_message_len = 55
-                    if len(clean_message) > max_message_len:
-                        message = clean_message[:max_message_len-3] + "..."
-                    else:
-                        message = clean_message
-                    
-                    files_count = len(target.files)
-                    lines_count = len(target.changed_lines)
-                    
-                    table_data.append([short_hash, message, files_count, lines_count])
-                
-                # Create table with colored headers
-                headers = [
-                    Colors.colorize("Hash", Colors.BRIGHT_CYAN, bold=True),
-                    Colors.colorize("Commit Message", Colors.WHITE, bold=True),
-                    Colors.colorize("Files", Colors.BRIGHT_BLUE, bold=True),
-                    Colors.colorize("Lines", Colors.BRIGHT_YELLOW, bold=True)
-                ]
-                
-                # Color the data
-                colored_data = []
-                for row in table_data:
-                    colored_row = [
-                        Colors.colorize(row[0], Colors.BRIGHT_CYAN, bold=True),  # hash
-                        row[1],  # message (no color for readability)
-                        Colors.colorize(str(row[2]), Colors.BRIGHT_BLUE),  # files
-                        Colors.colorize(str(row[3]), Colors.BRIGHT_YELLOW)  # lines
-                    ]
-                    colored_data.append(colored_row)
-                
-                # Print table
-                table_output = tabulate(colored_data, headers=headers, tablefmt="simple", stralign="left")
-                click.echo(table_output)
-            
-            else:
-                # Full detailed format
+                click.echo(Colors.colorize(header, Colors.WHITE, bold=True) + "\n")
+
+                # Full detailed format, buffered and written in one go
+                buf = io.StringIO()
                 for i, target in enumerate(targets, 1):
                     target_num = Colors.colorize(f"{i}.", Colors.BRIGHT_MAGENTA, bold=True)
                     commit_hash = Colors.colorize(target.commit_hash, Colors.BRIGHT_CYAN, bold=True)
-                    click.echo(f"{target_num} 🎯 Target Commit: {commit_hash}")
+                    print(f"{target_num} 🎯 Target Commit: {commit_hash}", file=buf)
                     
-                    # Commit message
-                    # Commit message with wrapping for long messages
+                    # Commit message, wrapped onto at most two lines
                     message_header = Colors.colorize("   💬 Message: ", Colors.WHITE, bold=True)
-                    if len(target.commit_message) > 80:
-                        # Split long messages across multiple lines
-                        first_line = target.commit_message[:77] + "..."
-                        click.echo(f"{message_header}{first_line}")
-                        if len(target.commit_message) > 150:
-                            second_line = "" + target.commit_message[77:150] + "..."
-                        else:
-                            second_line = "" + target.commit_message[77:]
-                        if second_line.strip():
-                            click.echo(Colors.colorize(f"   {second_line}", Colors.WHITE))
-                    else:
-                        click.echo(f"{message_header}{target.commit_message}")
+                    message_lines = textwrap.wrap(target.commit_message, width=77, max_lines=2, placeholder="...") or [""]
+                    print(f"{message_header}{message_lines[0]}", file=buf)
+                    if len(message_lines) > 1:
+                        print(Colors.colorize(f"   {message_lines[1]}", Colors.WHITE), file=buf)
                     
                     # Author (truncate if too long)
                     author_text = target.author[:50] + "..." if len(target.author) > 50 else target.author
                     author = Colors.colorize(f"   👤 Author: {author_text}", Colors.DIM)
-                    click.echo(author)
+                    print(author, file=buf)
                     
                     # File count
                     file_count = Colors.colorize(str(len(target.files)), Colors.BRIGHT_YELLOW)
-                    click.echo(f"   📁 Affected files: {file_count}")
+                    print(f"   📁 Affected files: {file_count}", file=buf)
                     
-                    for file_path in sorted(target.files):
-                        file_changes = [line for line in target.changed_lines if line.file_path == file_path]
-                        change_count = Colors.colorize(str(len(file_changes)), Colors.BRIGHT_BLUE)
+                    for file_path in target.files:
+                        file_changes = target.lines_by_file.get(file_path, [])
+                        file_change_count = len(file_changes)
+                        change_count = Colors.colorize(str(file_change_count), Colors.BRIGHT_BLUE)
                         file_name = Colors.colorize(file_path, Colors.BLUE, bold=True)
-                        click.echo(f"     📄 {file_name} ({change_count} changes)")
+                        print(f"     📄 {file_name} ({change_count} changes)", file=buf)
                         
                         for change in file_changes[:5]:  # Show first 5 changes per file
-                            change_type = change.change_type
-                            if change_type == 'added':
-                                symbol = Colors.colorize("+ ", Colors.BRIGHT_GREEN, bold=True)
-                            elif change_type == 'deleted':
-                                symbol = Colors.colorize("- ", Colors.BRIGHT_RED, bold=True)
-                            else:  # modified
-                                symbol = Colors.colorize("~ ", Colors.BRIGHT_YELLOW, bold=True)
-                            
+                            symbol = _CHANGE_SYMBOLS.get(change.change_type, _SYM_MOD)
                             line_num = Colors.colorize(f"Line {change.line_number}", Colors.CYAN)
                             content_preview = change.content[:50] + "..." if len(change.content) > 50 else change.content
                             content = Colors.colorize(content_preview, Colors.WHITE)
-                            click.echo(f"       {symbol}{line_num}: {content}")
+                            print(f"       {symbol}{line_num}: {content}", file=buf)
                         
-                        if len(file_changes) > 5:
-                            more_text = Colors.colorize(f"       ... and {len(file_changes) - 5} more changes", Colors.DIM)
-                            click.echo(more_text)
+                        if file_change_count > 5:
+                            more_text = Colors.colorize(f"       ... and {file_change_count - 5} more changes", Colors.DIM)
+                            print(more_text, file=buf)
                     
-                    click.echo()
+                    print(file=buf)
+                _write_output(buf.getvalue())
         else:
             # Brief status (original status command)
             if oneline:
-                # Create table data for compact format
-                table_data = []
-                for target in targets:
-                    short_hash = target.commit_hash[:8]
-                    
-                    # Truncate message for table display and clean up
-                    # Remove newlines and extra whitespace
-                    clean_message = ' '.join(target.commit_message.split())
-                    max_message_len = 55
-                    if len(clean_message) > max_message_len:
-                        message = clean_message[:max_message_len-3] + "..."
-                    else:
-                        message = clean_message
-                    
-                    files_count = len(target.files)
-                    lines_count = len(target.changed_lines)
-                    
-                    table_data.append([short_hash, message, files_count, lines_count])
-                
-                # Create table with colored headers
-                headers = [
-                    Colors.colorize("Hash", Colors.BRIGHT_CYAN, bold=True),
-                    Colors.colorize("Commit Message", Colors.WHITE, bold=True),
-                    Colors.colorize("Files", Colors.BRIGHT_BLUE, bold=True),
-                    Colors.colorize("Lines", Colors.BRIGHT_YELLOW, bold=True)
-                ]
-                
-                # Color the data
-                colored_data = []
-                for row in table_data:
-                    colored_row = [
-                        Colors.colorize(row[0], Colors.BRIGHT_CYAN, bold=True),  # hash
-                        row[1],  # message (no color for readability)
-                        Colors.colorize(str(row[2]), Colors.BRIGHT_BLUE),  # files
-                        Colors.colorize(str(row[3]), Colors.BRIGHT_YELLOW)  # lines
-                    ]
-                    colored_data.append(colored_row)
-                
-                # Print table
                 count_text = Colors.colorize(str(len(targets)), Colors.BRIGHT_GREEN, bold=True)
-                click.echo(f"Found {count_text} fixup targets:")
-                table_output = tabulate(colored_data, headers=headers, tablefmt="simple", stralign="left")
-                click.echo(table_output)
+                click.echo(f"Found {count_text} fixup targets:\n{_render_oneline_table(targets)}")
             else:
                 creator.status()
             
@@ -276,21 +247,23 @@ def status(repo, oneline, detailed, fixups_only, include_all, org_email, limit):
 @click.option('--no-backup', is_flag=True, help='Skip automatic safety backup')
 @click.option('--org-email', type=str, default='.*@intel.com', help='Regex pattern to match organization emails (default: .*@intel.com)')
 @click.option('--limit', type=str, help='Limit creation to commits after this SHA1 (commit hash)')
-def create(repo, dry_run, interactive, oneline, no_backup, org_email, limit):
+@click.option('--verbose', '-v', is_flag=True, help='List the git commands that were executed')
+def create(repo, dry_run, interactive, oneline, no_backup, org_email, limit, verbose):
     """Create fixup commits for identified targets."""
+    from .fixup_creator import FixupCreator
+    from .git_analyzer import compile_org_email_pattern
+
     try:
-        creator = FixupCreator(repo, org_email_pattern=org_email)
+        org_email_regex = compile_org_email_pattern(org_email)
+        creator = FixupCreator(repo, org_email_pattern=org_email_regex)
 
         # Display filter settings
-        filter_info = f"📧 Filtering by org email: {org_email}"
-        if limit:
-            filter_info += f" | 📍 Limit: {limit[:8]}..."
-        click.echo(Colors.colorize(filter_info, Colors.DIM))
+        click.echo(Colors.colorize(_format_filter_info(org_email, limit), Colors.DIM))
 
         if interactive:
             created_commits = creator.interactive_fixup_selection(compact_mode=oneline, dry_run=dry_run, limit_sha=limit)
         else:
-            created_commits = creator.create_fixup_commits(dry_run, auto_backup=not no_backup, limit_sha=limit)
+            created_commits = creator.create_fixup_commits(dry_run, auto_backup=not no_backup, limit_sha=limit, verbose=verbose)
         
         if created_commits and not dry_run:
             count_text = Colors.colorize(str(len(created_commits)), Colors.BRIGHT_GREEN, bold=True)
@@ -317,6 +290,8 @@ def create(repo, dry_run, interactive, oneline, no_backup, org_email, limit):
 @click.option('--backup-name', type=str, help='Specific backup name to restore')
 def restore(repo, backup_name):
     """Restore from a safety backup created by fastfixupfinder."""
+    from .fixup_creator import FixupCreator
+
     try:
         creator = FixupCreator(repo)
         success = creator.restore_from_backup(backup_name)
@@ -355,6 +330,8 @@ def resquash(commit_sha, repo):
 
     Note: You must be at the commit (HEAD) or in an interactive rebase.
     """
+    from .fixup_creator import FixupCreator
+
     try:
         creator = FixupCreator(repo)
         success = creator.resquash_commit(commit_sha)
@@ -367,10 +344,7 @@ def resquash(commit_sha, repo):
         sys.exit(1)
 
 
-@main.command()
-def help_usage():
-    """Show usage examples and workflow guidance."""
-    help_text = """
+_HELP_TEXT = """
 Fast Fixup Finder Usage Examples:
 
 1. Check what fixup targets are available:
@@ -414,7 +388,12 @@ The tool works by:
 Note: This tool works best when you have a clean commit history where
 each commit represents a logical change.
 """
-    click.echo(help_text)
+
+
+@main.command()
+def help_usage():
+    """Show usage examples and workflow guidance."""
+    click.echo(_HELP_TEXT)
 
 
 if __name__ == '__main__':
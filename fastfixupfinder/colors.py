@@ -0,0 +1,51 @@
+"""Terminal color handling for Fast Fixup Finder output."""
+
+import functools
+import os
+import sys
+
+
+_RESET = '\033[0m'
+_BOLD = '\033[1m'
+
+
+# Color constants for terminal output
+class Colors:
+    """ANSI color codes for terminal output."""
+    RESET = _RESET
+    BOLD = _BOLD
+    DIM = '\033[2m'
+    
+    # Basic colors
+    RED = '\033[31m'
+    GREEN = '\033[32m'
+    YELLOW = '\033[33m'
+    BLUE = '\033[34m'
+    MAGENTA = '\033[35m'
+    CYAN = '\033[36m'
+    WHITE = '\033[37m'
+    
+    # Bright colors
+    BRIGHT_RED = '\033[91m'
+    BRIGHT_GREEN = '\033[92m'
+    BRIGHT_YELLOW = '\033[93m'
+    BRIGHT_BLUE = '\033[94m'
+    BRIGHT_MAGENTA = '\033[95m'
+    BRIGHT_CYAN = '\033[96m'
+    
+    # Skip ANSI codes entirely when output is piped/redirected or NO_COLOR is set
+    enabled = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+    
+    @staticmethod
+    def colorize(text: str, color: str, bold: bool = False) -> str:
+        """Apply color and formatting to text."""
+        if not Colors.enabled:
+            return text
+        return colorize(text, color, bold)
+
+
+# The same hashes, banners and labels are colored over and over; build each string once
+@functools.lru_cache(maxsize=4096)
+def colorize(text: str, color: str, bold: bool = False) -> str:
+    """Wrap text in the given ANSI color (and bold) codes."""
+    return f"{_BOLD if bold else ''}{color}{text}{_RESET}"
@@ -1,64 +1,184 @@
 """Automated fixup commit creation functionality."""
 
+import io
+import os
+import re
 import subprocess
 import tempfile
 import shutil
+import sys
+import traceback
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Pattern, Set, Union
 
 import git
-from tabulate import tabulate
 
-from .git_analyzer import FixupTarget, GitAnalyzer, ChangeClassification
+from .colors import Colors
+from .tables import format_grid_table
+from .git_analyzer import DIFF_HUNK_RE, FixupTarget, GitAnalyzer, compile_org_email_pattern
 
-# Color constants for terminal output
-class Colors:
-    """ANSI color codes for terminal output."""
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
-    DIM = '\033[2m'
-    
-    # Basic colors
-    RED = '\033[31m'
-    GREEN = '\033[32m'
-    YELLOW = '\033[33m'
-    BLUE = '\033[34m'
-    MAGENTA = '\033[35m'
-    CYAN = '\033[36m'
-    WHITE = '\033[37m'
-    
-    # Bright colors
-    BRIGHT_RED = '\033[91m'
-    BRIGHT_GREEN = '\033[92m'
-    BRIGHT_YELLOW = '\033[93m'
-    BRIGHT_BLUE = '\033[94m'
-    BRIGHT_MAGENTA = '\033[95m'
-    BRIGHT_CYAN = '\033[96m'
-    
-    @staticmethod
-    def colorize(text: str, color: str, bold: bool = False) -> str:
-        """Apply color and formatting to text."""
-        prefix = Colors.BOLD if bold else ""
-        return f"{prefix}{color}{text}{Colors.RESET}"
+# Section separator used throughout the interactive workflow
+_SEPARATOR = Colors.colorize("━" * 80, Colors.CYAN)
+
+# Banners for when there is nothing to create or show
+_NO_TARGETS_MSG = Colors.colorize("🔍 No fixup targets found.", Colors.YELLOW)
+_NO_TARGETS_HINT = Colors.colorize("   Working directory is clean or no blame information available.", Colors.DIM)
+_NO_TARGETS_ONELINE_MSG = Colors.colorize("No fixup targets found.", Colors.YELLOW)
+
+# Colored +/-/~ markers for each change type, used once per rendered diff line
+_CHANGE_SYMBOLS = {
+    "added": Colors.colorize("+", Colors.BRIGHT_GREEN, bold=True),
+    "deleted": Colors.colorize("-", Colors.BRIGHT_RED, bold=True),
+    "modified": Colors.colorize("~", Colors.BRIGHT_YELLOW, bold=True),
+}
+
+# Marks unchanged lines skipped between two context blocks of the compact diff
+_DIFF_GAP = Colors.colorize("  ...", Colors.DIM)
+
+# Selection state markers in the interactive target list
+_CHECKBOX_ON = Colors.colorize("[✓]", Colors.BRIGHT_GREEN, bold=True)
+_CHECKBOX_OFF = Colors.colorize("[ ]", Colors.DIM)
+
+# Commands accepted by the interactive target selection
+_SELECTION_HELP = Colors.colorize("Commands: 1,3,5 | 1-3 (range) | all | info N | done", Colors.DIM)
+
+# Prompts of the interactive target selection
+_SELECTION_PROMPT = Colors.colorize("→ ", Colors.BRIGHT_CYAN)
+_CONTINUE_PROMPT = Colors.colorize("\n[Press Enter to continue]", Colors.DIM)
+
+# Non-numeric commands of the interactive target selection: done, all, info N (or a malformed info)
+_SELECTION_COMMAND_RE = re.compile(r'(?P<cmd>done|all)|info\s+(?P<info_idx>\d+)|info\b.*', re.IGNORECASE)
+
+# One entry of a target selection: a number or a range like 1-3
+_SELECTION_PART_RE = re.compile(r'(\d+)(?:-(\d+))?')
+
+# Environment for git plumbing subprocesses: never start a pager and skip locale handling
+_GIT_ENV = dict(os.environ, GIT_PAGER='cat', LC_ALL='C')
+
+# Answers accepted for a [Y/n] prompt; empty takes the default
+_YES_ANSWERS = frozenset({'', 'y', 'yes'})
+_RESQUASH_CONFIRM_PROMPT = Colors.colorize("Convert fixup to squash? [Y/n]: ", Colors.BRIGHT_YELLOW)
+
+
+# Escapes git uses in C-quoted path names, besides three-digit octal bytes
+_C_QUOTE_ESCAPES = {'a': 7, 'b': 8, 't': 9, 'n': 10, 'v': 11, 'f': 12, 'r': 13, '"': 34, '\\': 92}
+
+
+def _header_path(text: str) -> str:
+    """Path named in a '--- a/...' or '+++ b/...' diff header (after the marker), prefix included.
+
+    Git C-quotes names with unusual characters and appends a tab to names
+    containing a space; both are undone here.
+    """
+    if not text.startswith('"'):
+        return text[:-1] if text.endswith('\t') else text
+    raw = bytearray()
+    i, end = 1, text.rindex('"')
+    while i < end:
+        ch = text[i]
+        if ch != '\\':
+            raw += ch.encode('utf-8', 'surrogateescape')
+            i += 1
+        elif text[i + 1] in _C_QUOTE_ESCAPES:
+            raw.append(_C_QUOTE_ESCAPES[text[i + 1]])
+            i += 2
+        else:
+            raw.append(int(text[i + 1:i + 4], 8))
+            i += 4
+    return raw.decode('utf-8', 'surrogateescape')
+
+
+@dataclass(eq=False)
+class _DiffHunk:
+    """A zero-context hunk of the working tree diff, in index coordinates."""
+    old_start: int
+    old_count: int
+    new_start: int
+    new_count: int
+    body: List[str]
+
+    @property
+    def preceding_line(self) -> int:
+        """Last unchanged line before the hunk in the old file (0 for the file start)."""
+        return self.old_start - 1 if self.old_count else self.old_start
+
+    def contains(self, old_lines: Set[int], new_lines: Set[int]) -> bool:
+        """Whether any removed line is in old_lines or any added line is in new_lines."""
+        return (any(self.old_start <= n < self.old_start + self.old_count for n in old_lines) or
+                any(self.new_start <= n < self.new_start + self.new_count for n in new_lines))
+
+
+@dataclass
+class _FileDiff:
+    """Diff header and hunks of one file."""
+    header: List[str]
+    hunks: List[_DiffHunk] = field(default_factory=list)
+
+
+def _read_line(prompt: str) -> str:
+    """Prompt for a line of input; when stdin is not a terminal, read it without a prompt.
+
+    Raises:
+        EOFError: If input has run out, like input() does
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    # Scripted input: skip the prompt and readline handling
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
 
 
 class FixupCreator:
     """Creates fixup commits automatically."""
     
-    def __init__(self, repo_path: str = ".", org_email_pattern: Optional[str] = None):
+    def __init__(self, repo_path: str = ".", org_email_pattern: Optional[Union[str, Pattern[str]]] = None):
         """Initialize with repository path and optional organization email pattern.
         
         Args:
             repo_path: Path to the git repository
-            org_email_pattern: Regex pattern to match organization emails. Only commits by authors 
-                              matching this pattern will be considered for fixups.
+            org_email_pattern: Regex (string or compiled) to match organization emails. Only commits
+                              by authors matching this pattern will be considered for fixups.
         """
-        self.repo = git.Repo(repo_path)
         self.repo_path = Path(repo_path)
-        self.analyzer = GitAnalyzer(repo_path)
+        # Compiled once here and shared by status, create and interactive filtering
+        if isinstance(org_email_pattern, str):
+            org_email_pattern = compile_org_email_pattern(org_email_pattern)
         self.org_email_pattern = org_email_pattern
+        # Working tree file contents read by _get_compact_diff, kept while one diff table is built
+        self._file_lines_cache: Dict[str, List[bytes]] = {}
+
+    # Opened on first use: resquash and restore never need the analyzer
+    @cached_property
+    def repo(self) -> git.Repo:
+        """The git repository, opened on first access."""
+        return git.Repo(self.repo_path)
+
+    @cached_property
+    def analyzer(self) -> GitAnalyzer:
+        """The change analyzer, created on first access."""
+        return GitAnalyzer(str(self.repo_path))
     
-    def create_fixup_commits(self, dry_run: bool = False, auto_backup: bool = True, limit_sha: Optional[str] = None) -> List[str]:
+    def _report_no_targets(self, oneline: bool = False) -> None:
+        """Explain why there is nothing to do, after find_fixup_targets came back empty."""
+        filtered_count = self.analyzer.author_filtered_count
+        if filtered_count:
+            prefix = "" if oneline else "🔍 "
+            print(Colors.colorize(f"{prefix}Found {filtered_count} fixup targets, but none match organization email pattern '{self.org_email_pattern.pattern}'.", Colors.YELLOW))
+        elif oneline:
+            print(_NO_TARGETS_ONELINE_MSG)
+        else:
+            print(_NO_TARGETS_MSG)
+            print(_NO_TARGETS_HINT)
+
+    def create_fixup_commits(self, dry_run: bool = False, auto_backup: bool = True, limit_sha: Optional[str] = None,
+                             verbose: bool = False) -> List[str]:
         """Create fixup commits for all identified targets.
 
         This method creates only fixup commits. To convert fixups to squash with
@@ -69,35 +189,30 @@ class FixupCreator:
             dry_run: If True, show what would be done without making changes
             auto_backup: If True, create automatic git stash backup
             limit_sha: Optional SHA1 to limit creation to commits after this point
+            verbose: If True, list the git commands that were executed (always listed for dry runs)
         """
-        # Get all fixup targets first
-        all_fixup_targets = self.analyzer.find_fixup_targets(limit_sha=limit_sha)  # Uses SMART_DEFAULT
+        # Get fixup targets, keeping only those by organization authors if a pattern is set
+        fixup_targets = self.analyzer.find_fixup_targets(limit_sha=limit_sha, filter_author_email=self.org_email_pattern)  # Uses SMART_DEFAULT
         created_commits = []
         git_commands = []  # Track git commands for display
 
-        # Apply organization filtering if specified
-        if self.org_email_pattern:
-            fixup_targets = self.analyzer.filter_targets_by_organization(all_fixup_targets, self.org_email_pattern)
-            if not fixup_targets:
-                if all_fixup_targets:
-                    print(Colors.colorize(f"🔍 Found {len(all_fixup_targets)} fixup targets, but none match organization email pattern '{self.org_email_pattern}'.", Colors.YELLOW))
-                else:
-                    print(Colors.colorize("🔍 No fixup targets found.", Colors.YELLOW))
-                    print(Colors.colorize("   Working directory is clean or no blame information available.", Colors.DIM))
-                return created_commits
-        else:
-            fixup_targets = all_fixup_targets
-            if not fixup_targets:
-                print(Colors.colorize("🔍 No fixup targets found.", Colors.YELLOW))
-                print(Colors.colorize("   Working directory is clean or no blame information available.", Colors.DIM))
-                return created_commits
+        if not fixup_targets:
+            self._report_no_targets()
+            return created_commits
 
         # Show targets in table format (like status command)
         self._show_diff_table(fixup_targets, context_lines=4)
 
-        if not dry_run:
+        if dry_run:
+            # Collect the commands each target would run, without touching the repository
+            for target in fixup_targets:
+                git_commands.extend(self._dry_run_commands(target, "fixup", None))
+            git_commands.append("git update-ref HEAD <last commit>")
+            git_commands.append("git apply --cached --unidiff-zero  # sync index with new HEAD")
+        else:
             # Store target commits for later rebase suggestion
             self._target_commits = [target.commit_hash for target in fixup_targets]
+            self._rebase_parent = self._find_rebase_parent(self._target_commits)
 
             # Create automatic backup of HEAD (not working directory) before making changes
             if auto_backup:
@@ -107,24 +222,14 @@ class FixupCreator:
             print(Colors.colorize("🚀 Creating fixup commits...", Colors.WHITE, bold=True))
             print()
 
-            for target in fixup_targets:
-                commit_hash, commands = self.create_fixup_commit(target, dry_run, commit_type="fixup", custom_message=None)
-                if commit_hash:
-                    created_commits.append(commit_hash)
-                git_commands.extend(commands)
+            created_commits = self._create_fixup_chain(fixup_targets, git_commands)
 
-        # For dry-run, collect commands from all targets
-        if dry_run:
-            for target in fixup_targets:
-                _, commands = self.create_fixup_commit(target, dry_run, commit_type="fixup", custom_message=None)
-                git_commands.extend(commands)
-
-        # Show git commands table at the end
-        if git_commands:
+        # Show git commands table at the end; it is the whole output of a dry run
+        if git_commands and (dry_run or verbose):
             self._show_git_commands_table(git_commands, dry_run)
 
         # Suggest resquash workflow
-        if created_commits and not dry_run:
+        if created_commits:
             print()
             print(Colors.colorize("💡 Tip: To convert any fixup to squash with message editing:", Colors.CYAN))
             print(Colors.colorize("   fastfixupfinder resquash <commit-sha>", Colors.WHITE, bold=True))
@@ -140,6 +245,9 @@ class FixupCreator:
     ) -> tuple[Optional[str], list[str]]:
         """Create a single fixup or squash commit for the given target.
 
+        The commit is written with git plumbing (write-tree/commit-tree) rather
+        than `git commit`, see _create_fixup_chain.
+
         Args:
             target: The fixup target
             dry_run: If True, only show what would be done
@@ -149,71 +257,154 @@ class FixupCreator:
         Returns:
             tuple: (commit_hash, git_commands_list)
         """
+        if dry_run:
+            commands = self._dry_run_commands(target, commit_type, custom_message)
+            commands.append("git update-ref HEAD <commit>")
+            commands.append("git apply --cached --unidiff-zero  # sync index with new HEAD")
+            return None, commands
+
         commands = []
-        try:
-            # Prepare for fixup commit creation
-            short_hash = target.commit_hash[:8]
-            
-            if dry_run:
-                # Capture commands that would be executed with line-level precision
-                for file_path in target.files:
-                    # Get target lines for this file
-                    target_lines = [cl.line_number for cl in target.changed_lines if cl.file_path == file_path]
-                    if target_lines:
-                        line_info = f"lines {sorted(target_lines)}"
-                        commands.append(f"git add --patch {file_path}  # auto-select {line_info}")
-
-                # Add commit command based on type
-                if commit_type == "squash":
-                    message_to_use = custom_message or target.commit_message
-                    commands.append(f'git commit --squash {target.commit_hash} -m "{message_to_use}" --no-verify')
-                else:
-                    commands.append(f'git commit --fixup {target.commit_hash} --no-verify')
-                return None, commands
-            
-            # Stage only the specific lines related to this target using --patch
-            staged_files = []
-            for file_path in target.files:
-                if (self.repo_path / file_path).exists():
-                    success = self._stage_lines_for_target(target, file_path, commands)
-                    if success:
-                        staged_files.append(file_path)
-            
-            if not staged_files:
-                target_hash = Colors.colorize(short_hash, Colors.BRIGHT_CYAN, bold=True)
+        created = self._create_fixup_chain([target], commands, commit_type, custom_message)
+        return (created[0] if created else None), commands
+
+    def _fixup_commit_message(self, target: FixupTarget, commit_type: str, custom_message: Optional[str]) -> str:
+        """Build the message `git commit --fixup/--squash` would use for the target."""
+        # Like git's %s: the first paragraph of the message folded onto one line
+        subject = ' '.join(target.commit_message.split('\n\n', 1)[0].split('\n'))
+        if commit_type == "squash":
+            return f"squash! {subject}\n\n{custom_message or target.commit_message}"
+        return f"fixup! {subject}"
+
+    def _dry_run_commands(self, target: FixupTarget, commit_type: str, custom_message: Optional[str]) -> List[str]:
+        """Commands that would stage and commit the target, with line-level precision."""
+        message = self._fixup_commit_message(target, commit_type, custom_message)
+        return [
+            f"GIT_INDEX_FILE=<tmp> git apply --cached --unidiff-zero  # {self._target_lines_summary(target)}",
+            "GIT_INDEX_FILE=<tmp> git write-tree",
+            f'git commit-tree <tree> -p <parent> -m "{message}"',
+        ]
+
+    def _target_lines_summary(self, target: FixupTarget) -> str:
+        """Describe the target's lines per file, e.g. 'a.py lines [3, 7]'."""
+        return '; '.join(f"{path} lines {sorted({cl.line_number for cl in lines})}"
+                         for path, lines in sorted(target.lines_by_file.items()))
+
+    def _advance_head(self, new_head: str, old_head: str, commands: list) -> None:
+        """Point HEAD (and the branch it refers to) at new_head in a single ref update."""
+        self.repo.git.update_ref('-m', 'fastfixupfinder: create fixup commits', 'HEAD', new_head, old_head)
+        commands.append(f"git update-ref HEAD {new_head[:8]} {old_head[:8]}")
+
+    def _create_fixup_chain(
+        self,
+        targets: List[FixupTarget],
+        commands: list,
+        commit_type: str = "fixup",
+        custom_message: Optional[str] = None
+    ) -> List[str]:
+        """Create fixup commits for targets as one chain, moving HEAD only once at the end.
+
+        Commit k of the chain holds the hunks of targets 1..k on top of the
+        current index. Those trees don't depend on each other, so each is
+        staged in its own temporary index file on a thread pool; only the
+        commit-tree calls that link the chain run in order.
+
+        Returns:
+            Hashes of the created commits, oldest first
+        """
+        created_commits = []
+        original_head = self.repo.head.commit.hexsha
+        file_diffs = self._read_worktree_hunks()
+
+        # Hand out hunks in target order so each belongs to the first target containing its lines
+        claimed = set()
+        staged_targets = []
+        patches = []
+        for target in targets:
+            target_hunks = self._claim_target_hunks(target, file_diffs, claimed)
+            if not target_hunks:
+                target_hash = Colors.colorize(target.short_hash, Colors.BRIGHT_CYAN, bold=True)
                 print(Colors.colorize(f"⚠️  No files to stage for target {target_hash}", Colors.YELLOW))
-                return None, commands
-            
-            # Create the fixup or squash commit
-            if commit_type == "squash":
-                message_to_use = custom_message or target.commit_message
-                commands.append(f'git commit --squash {target.commit_hash} -m "{message_to_use}" --no-verify')
-                # Git automatically adds 'squash!' prefix
-                self.repo.git.commit(
-                    f'--squash={target.commit_hash}',
-                    '-m', message_to_use,
-                    '--no-verify'
-                )
-                commit_type_display = "squash"
-            else:
-                commands.append(f'git commit --fixup {target.commit_hash} --no-verify')
-                self.repo.git.commit(f'--fixup={target.commit_hash}', '--no-verify')
-                commit_type_display = "fixup"
+                continue
+            claimed.update(target_hunks)
+            staged_targets.append(target)
+            patches.append(self._build_partial_patch(file_diffs, claimed))
+
+        if not patches:
+            return created_commits
+
+        with tempfile.TemporaryDirectory(prefix='fastfixupfinder-') as index_dir:
+            index_files = [str(Path(index_dir) / f"index.{i}") for i in range(len(patches))]
+            with ThreadPoolExecutor(max_workers=min(len(patches), os.cpu_count() or 1)) as pool:
+                trees = list(pool.map(self._stage_and_write_tree, patches, index_files))
+
+        parent = original_head
+        last_patch = None
+        for target, patch, tree in zip(staged_targets, patches, trees):
+            target_hash = Colors.colorize(target.short_hash, Colors.BRIGHT_CYAN, bold=True)
+            if isinstance(tree, Exception):
+                # Later patches contain this one, so they can't apply either
+                print(Colors.colorize(f"❌ Error creating fixup commit for {target_hash}: {tree}", Colors.BRIGHT_RED))
+                break
+
+            commands.append(f"GIT_INDEX_FILE=<tmp> git apply --cached --unidiff-zero  # {self._target_lines_summary(target)}")
+            commands.append("GIT_INDEX_FILE=<tmp> git write-tree")
+            message = self._fixup_commit_message(target, commit_type, custom_message)
+            commit_hash = self._append_commit(tree, parent, message, commands)
+            created_commits.append(commit_hash)
+            parent = commit_hash
+            last_patch = patch
 
-            # Get the hash of the newly created commit
-            commit_hash = self.repo.head.commit.hexsha
             new_hash = Colors.colorize(commit_hash[:8], Colors.BRIGHT_GREEN, bold=True)
-            target_hash = Colors.colorize(short_hash, Colors.BRIGHT_CYAN, bold=True)
-            print(f"✅ Created {commit_type_display} commit {new_hash} for {target_hash}")
+            print(f"✅ Created {commit_type} commit {new_hash} for {target_hash}")
 
-            return commit_hash, commands
-            
+        if created_commits:
+            self._advance_head(parent, original_head, commands)
+            # Bring the real index up to the new HEAD for the committed hunks
+            self._run_git('apply', '--cached', '--unidiff-zero', '-', input=last_patch, check=True)
+            commands.append("git apply --cached --unidiff-zero  # sync index with new HEAD")
+        return created_commits
+
+    def _run_git(self, *args: str, index_file: Optional[str] = None, **kwargs) -> subprocess.CompletedProcess:
+        """Run a git plumbing command in the repository, capturing its output.
+
+        Args:
+            args: git subcommand and its arguments
+            index_file: Index file to use instead of the repository's own
+            kwargs: Passed on to subprocess.run (input, check, ...)
+        """
+        env = _GIT_ENV if index_file is None else dict(_GIT_ENV, GIT_INDEX_FILE=index_file)
+        return subprocess.run(['git', '--no-pager', *args], cwd=self.repo_path, env=env,
+                              capture_output=True, **kwargs)
+
+    def _stage_and_write_tree(self, patch: bytes, index_file: str):
+        """Apply patch to a private copy of the index and write it as a tree.
+
+        Safe to run from several threads at once: nothing is shared but the
+        object store. Returns the tree hash, or the exception on failure.
+        """
+        try:
+            real_index = Path(self.repo.git_dir) / 'index'
+            if real_index.exists():
+                shutil.copyfile(real_index, index_file)
+            else:
+                self._run_git('read-tree', 'HEAD', index_file=index_file, check=True)
+
+            apply_result = self._run_git('apply', '--cached', '--unidiff-zero', '-',
+                                         index_file=index_file, input=patch)
+            if apply_result.returncode != 0:
+                raise RuntimeError(apply_result.stderr.decode('utf-8', 'replace').strip())
+
+            tree_result = self._run_git('write-tree', index_file=index_file, check=True)
+            return tree_result.stdout.decode().strip()
         except Exception as e:
-            target_hash = Colors.colorize(target.commit_hash[:8], Colors.BRIGHT_CYAN, bold=True)
-            error_msg = Colors.colorize(f"❌ Error creating fixup commit for {target_hash}: {e}", Colors.BRIGHT_RED)
-            print(error_msg)
-            return None, commands
-    
+            return e
+
+    def _append_commit(self, tree: str, parent: str, message: str, commands: list) -> str:
+        """Create a commit of tree on top of parent without touching HEAD or the index."""
+        commit_hash = self.repo.git.commit_tree(tree, '-p', parent, '-m', message)
+        commands.append(f'git commit-tree {tree[:8]} -p {parent[:8]} -m "{message}"')
+        return commit_hash
+
     def interactive_fixup_selection(self, compact_mode: bool = False, dry_run: bool = False, limit_sha: Optional[str] = None) -> List[str]:
         """Interactively select which fixup commits to create with streamlined workflow.
 
@@ -230,26 +421,13 @@ class FixupCreator:
             dry_run: If True, show what would be done without making changes
             limit_sha: Optional SHA1 to limit to commits after this point
         """
-        # Get all fixup targets first
-        all_fixup_targets = self.analyzer.find_fixup_targets(limit_sha=limit_sha)  # Uses SMART_DEFAULT
+        # Get fixup targets, keeping only those by organization authors if a pattern is set
+        fixup_targets = self.analyzer.find_fixup_targets(limit_sha=limit_sha, filter_author_email=self.org_email_pattern)  # Uses SMART_DEFAULT
         created_commits = []
 
-        # Apply organization filtering if specified
-        if self.org_email_pattern:
-            fixup_targets = self.analyzer.filter_targets_by_organization(all_fixup_targets, self.org_email_pattern)
-            if not fixup_targets:
-                if all_fixup_targets:
-                    print(Colors.colorize(f"🔍 Found {len(all_fixup_targets)} fixup targets, but none match organization email pattern '{self.org_email_pattern}'.", Colors.YELLOW))
-                else:
-                    print(Colors.colorize("🔍 No fixup targets found.", Colors.YELLOW))
-                    print(Colors.colorize("   Working directory is clean or no blame information available.", Colors.DIM))
-                return created_commits
-        else:
-            fixup_targets = all_fixup_targets
-            if not fixup_targets:
-                print(Colors.colorize("🔍 No fixup targets found.", Colors.YELLOW))
-                print(Colors.colorize("   Working directory is clean or no blame information available.", Colors.DIM))
-                return created_commits
+        if not fixup_targets:
+            self._report_no_targets()
+            return created_commits
 
         count_text = Colors.colorize(str(len(fixup_targets)), Colors.BRIGHT_GREEN, bold=True)
         print()
@@ -263,36 +441,33 @@ class FixupCreator:
 
         # Step 2: Show auto-assigned lines (what will be committed)
         print()
-        print(Colors.colorize("━" * 80, Colors.CYAN))
+        print(_SEPARATOR)
         print(Colors.colorize("🔍 Line Assignment Summary", Colors.WHITE, bold=True))
         print(Colors.colorize("All lines auto-assigned based on git blame analysis", Colors.DIM))
         print()
         for i, target in enumerate(selected_targets, 1):
-            file_summary = {}
-            for cl in target.changed_lines:
-                file_summary[cl.file_path] = file_summary.get(cl.file_path, 0) + 1
+            file_summary = Counter(cl.file_path for cl in target.changed_lines)
 
-            print(f"  {Colors.colorize(f'{i}.', Colors.BRIGHT_MAGENTA, bold=True)} {Colors.colorize(target.commit_hash[:8], Colors.BRIGHT_CYAN, bold=True)}")
+            print(f"  {Colors.colorize(f'{i}.', Colors.BRIGHT_MAGENTA, bold=True)} {Colors.colorize(target.short_hash, Colors.BRIGHT_CYAN, bold=True)}")
             for file_path, count in sorted(file_summary.items()):
                 print(f"     📁 {Colors.colorize(file_path, Colors.BRIGHT_BLUE)}: {count} lines")
 
         # Step 3: Create all fixup commits
         print()
-        print(Colors.colorize("━" * 80, Colors.CYAN))
+        print(_SEPARATOR)
         print(Colors.colorize("🚀 Creating fixup commits...", Colors.WHITE, bold=True))
         print()
 
         # Store target commits for later rebase suggestion
         self._target_commits = [target.commit_hash for target in selected_targets]
+        self._rebase_parent = self._find_rebase_parent(self._target_commits)
 
-        for i, target in enumerate(selected_targets, 1):
-            commit_hash, _ = self.create_fixup_commit(target, dry_run, commit_type="fixup", custom_message=None)
-            if commit_hash:
-                created_commits.append(commit_hash)
+        if not dry_run:
+            created_commits = self._create_fixup_chain(selected_targets, [])
 
         # Summary
         print()
-        print(Colors.colorize("━" * 80, Colors.CYAN))
+        print(_SEPARATOR)
         summary = f"✅ Created {len(created_commits)} fixup commit(s)"
         print(Colors.colorize(summary, Colors.BRIGHT_GREEN, bold=True))
 
@@ -304,241 +479,54 @@ class FixupCreator:
 
         return created_commits
     
-    def _interactive_line_classification_DEPRECATED(self, target: FixupTarget, compact_mode: bool = False) -> Optional[FixupTarget]:
-        """Interactive classification control for individual lines within a target.
-        
-        Args:
-            target: The fixup target to review
-            compact_mode: Use compact output for better readability
-        """
-        if compact_mode:
-            header = f"🔍 {target.commit_hash[:8]}: {target.commit_message[:40]}..."
-            print(Colors.colorize(header, Colors.WHITE, bold=True))
-        else:
-            print()
-            header = f"🔍 Reviewing lines for target {target.commit_hash[:8]}: {target.commit_message[:50]}..."
-            print(Colors.colorize(header, Colors.WHITE, bold=True))
-            print()
-        
-        # Group lines by file for better organization
-        files_lines = {}
-        for line in target.changed_lines:
-            if line.file_path not in files_lines:
-                files_lines[line.file_path] = []
-            files_lines[line.file_path].append(line)
-        
-        selected_lines = []
-        
-        for file_path, lines in files_lines.items():
-            if compact_mode:
-                file_header = Colors.colorize(f"📄 {file_path}", Colors.BLUE, bold=True)
-                print(file_header)
-            else:
-                file_header = Colors.colorize(f"📄 {file_path}", Colors.BLUE, bold=True)
-                print(file_header)
-                print()
-            
-            # Show line count and summary in compact mode
-            if compact_mode:
-                total_lines = len(lines)
-                likely_count = sum(1 for l in lines if l.classification.value == 'likely_fixup')
-                possible_count = sum(1 for l in lines if l.classification.value == 'possible_fixup')
-                unlikely_count = sum(1 for l in lines if l.classification.value == 'unlikely_fixup')
-                
-                summary = f"  {total_lines} lines: "
-                if likely_count > 0:
-                    summary += Colors.colorize(f"{likely_count} likely", Colors.BRIGHT_GREEN) + " "
-                if possible_count > 0:
-                    summary += Colors.colorize(f"{possible_count} possible", Colors.BRIGHT_YELLOW) + " "
-                if unlikely_count > 0:
-                    summary += Colors.colorize(f"{unlikely_count} unlikely", Colors.BRIGHT_RED)
-                print(summary.strip())
-            
-            # Show individual lines (with limits in compact mode)
-            display_lines = lines[:10] if compact_mode else lines
-            
-            for i, line in enumerate(display_lines, 1):
-                # Show current classification with color coding
-                classification_color = self._get_classification_color(line.classification)
-                classification_short = line.classification.value.replace('_fixup', '').replace('_file', '').replace('_', ' ').title()
-                
-                # Show change type symbol
-                if line.change_type == 'added':
-                    symbol = Colors.colorize("+", Colors.BRIGHT_GREEN, bold=True)
-                elif line.change_type == 'deleted':
-                    symbol = Colors.colorize("-", Colors.BRIGHT_RED, bold=True)
-                else:  # modified
-                    symbol = Colors.colorize("~", Colors.BRIGHT_YELLOW, bold=True)
-                
-                line_num = Colors.colorize(f"L{line.line_number}", Colors.CYAN)
-                
-                if compact_mode:
-                    # Compact format: shorter content and inline classification
-                    content_preview = line.content[:40] + "..." if len(line.content) > 40 else line.content
-                    content = Colors.colorize(content_preview.strip(), Colors.WHITE)
-                    classification_text = Colors.colorize(f"[{classification_short}]", classification_color)
-                    print(f"  {i}. {symbol} {line_num}: {content} {classification_text}")
-                else:
-                    # Full format: longer content and separate classification line
-                    content_preview = line.content[:80] + "..." if len(line.content) > 80 else line.content
-                    content = Colors.colorize(content_preview.strip(), Colors.WHITE)
-                    classification_text = Colors.colorize(
-                        line.classification.value.replace('_', ' ').title(), 
-                        classification_color, bold=True
-                    )
-                    print(f"  {i}. {symbol} Line {line.line_number}: {content}")
-                    print(f"     Classification: {classification_text}")
-                    print()
-            
-            # Show truncation notice in compact mode
-            if compact_mode and len(lines) > 10:
-                remaining = len(lines) - 10
-                truncated_msg = Colors.colorize(f"  ... and {remaining} more lines", Colors.DIM)
-                print(truncated_msg)
-            
-            if not compact_mode:
-                print()
-            
-            # Ask user which lines to include
-            while True:
-                try:
-                    if compact_mode:
-                        prompt = Colors.colorize(f"🎯 Select from {file_path[:20]}{'...' if len(file_path) > 20 else ''} ", Colors.BRIGHT_CYAN, bold=True)
-                        options = Colors.colorize("(#s, 'all', 'none', 'auto')", Colors.DIM)
-                    else:
-                        prompt = Colors.colorize(f"🎯 Select lines from {file_path} ", Colors.BRIGHT_CYAN, bold=True)
-                        options = Colors.colorize("(numbers, 'all', 'none', or 'auto' for current classification)", Colors.DIM)
-                    selection = input(f"{prompt}{options}: ").strip()
-                    
-                    if selection.lower() == 'none':
-                        break  # Skip this file
-                    elif selection.lower() == 'all':
-                        selected_lines.extend(lines)
-                        break
-                    elif selection.lower() == 'auto':
-                        # Use current automatic classification - include likely and possible fixups
-                        auto_lines = [l for l in lines if l.classification in [
-                            ChangeClassification.LIKELY_FIXUP, 
-                            ChangeClassification.POSSIBLE_FIXUP
-                        ]]
-                        selected_lines.extend(auto_lines)
-                        auto_count = Colors.colorize(str(len(auto_lines)), Colors.BRIGHT_GREEN, bold=True)
-                        print(f"  ✅ Auto-selected {auto_count} lines based on classification")
-                        break
-                    else:
-                        # Parse line numbers
-                        line_indices = []
-                        for num_str in selection.split(','):
-                            num_str = num_str.strip()
-                            if '-' in num_str:  # Range like "1-3"
-                                start, end = map(int, num_str.split('-'))
-                                line_indices.extend(range(start-1, end))
-                            else:
-                                line_indices.append(int(num_str) - 1)
-                        
-                        # Validate indices
-                        if all(0 <= i < len(lines) for i in line_indices):
-                            selected_lines.extend([lines[i] for i in line_indices])
-                            selected_count = Colors.colorize(str(len(line_indices)), Colors.BRIGHT_GREEN, bold=True)
-                            print(f"  ✅ Selected {selected_count} lines")
-                            break
-                        else:
-                            error_msg = Colors.colorize("❌ Invalid selection. Please try again.", Colors.BRIGHT_RED)
-                            print(error_msg)
-                            continue
-                except ValueError:
-                    error_msg = Colors.colorize("❌ Invalid input. Use numbers, ranges (1-3), or keywords.", Colors.BRIGHT_RED)
-                    print(error_msg)
-                    continue
-            
-            print()
-        
-        if not selected_lines:
-            print(Colors.colorize("⚠️  No lines selected for this target.", Colors.YELLOW))
-            return None
-        
-        # Create new target with only selected lines
-        selected_files = {line.file_path for line in selected_lines}
-        enhanced_target = FixupTarget(
-            commit_hash=target.commit_hash,
-            commit_message=target.commit_message,
-            author=target.author,
-            changed_lines=selected_lines,
-            files=selected_files
-        )
-        
-        total_selected = Colors.colorize(str(len(selected_lines)), Colors.BRIGHT_GREEN, bold=True)
-        total_files = Colors.colorize(str(len(selected_files)), Colors.BRIGHT_BLUE, bold=True)
-        print(f"✅ Final selection: {total_selected} lines across {total_files} files")
-        
-        return enhanced_target
-    
-    def _get_classification_color(self, classification: 'ChangeClassification') -> str:
-        """Get color for classification display."""
-        from .git_analyzer import ChangeClassification
-        
-        color_map = {
-            ChangeClassification.LIKELY_FIXUP: Colors.BRIGHT_GREEN,
-            ChangeClassification.POSSIBLE_FIXUP: Colors.BRIGHT_YELLOW,
-            ChangeClassification.UNLIKELY_FIXUP: Colors.BRIGHT_RED,
-            ChangeClassification.NEW_FILE: Colors.BRIGHT_MAGENTA
-        }
-        return color_map.get(classification, Colors.WHITE)
-    
     def suggest_rebase_command(self, created_commits: List[str]) -> None:
         """Suggest the appropriate git rebase command."""
         if not created_commits:
             return
         
-        # Use stored target commits from before fixup creation
-        target_commits = getattr(self, '_target_commits', [])
+        # Worked out from the target commits before fixup creation (see _find_rebase_parent)
+        parent_commit = getattr(self, '_rebase_parent', None)
         
-        if not target_commits:
-            # Fallback to generic suggestion
-            print()
-            header = Colors.colorize("🚀 To apply the fixup commits, run:", Colors.WHITE, bold=True)
-            print(header)
-            command = Colors.colorize("git rebase -i --autosquash HEAD~<number_of_commits>", Colors.BRIGHT_GREEN, bold=True)
-            print(f"    {command}")
-            hint = Colors.colorize("    (Replace <number_of_commits> with appropriate count)", Colors.DIM)
-            print(hint)
-            return
-        
-        # Find common ancestor or suggest interactive rebase
-        try:
-            # Get the oldest target commit
-            oldest_commit = self.repo.git.merge_base(*target_commits).strip()
-            parent_commit = self.repo.git.rev_parse(f"{oldest_commit}^")
-            
-            print()
-            header = Colors.colorize("🚀 To apply the fixup commits, run:", Colors.WHITE, bold=True)
-            print(header)
+        print()
+        header = Colors.colorize("🚀 To apply the fixup commits, run:", Colors.WHITE, bold=True)
+        print(header)
+        if parent_commit:
             command = Colors.colorize(f"git rebase -i --autosquash {parent_commit}", Colors.BRIGHT_GREEN, bold=True)
             print(f"    {command}")
-            
-        except git.exc.GitCommandError:
-            print()
-            header = Colors.colorize("🚀 To apply the fixup commits, run:", Colors.WHITE, bold=True)
-            print(header)
+        else:
+            # Fallback to generic suggestion
             command = Colors.colorize("git rebase -i --autosquash HEAD~<number_of_commits>", Colors.BRIGHT_GREEN, bold=True)
             print(f"    {command}")
             hint = Colors.colorize("    (Replace <number_of_commits> with appropriate count)", Colors.DIM)
             print(hint)
+
+    def _find_rebase_parent(self, target_commits: List[str]) -> Optional[str]:
+        """Return the parent of the oldest target commit, or None if there is none."""
+        if not target_commits:
+            return None
+        try:
+            # A single target is its own merge base, no need to ask git
+            if len(set(target_commits)) == 1:
+                oldest_commit = target_commits[0]
+            else:
+                # Without --octopus, git takes the merge base of the first commit
+                # against a merge of the others, which need not be the oldest
+                oldest_commit = self.repo.git.merge_base('--octopus', *target_commits).strip()
+            parents = self.repo.commit(oldest_commit).parents
+        except (git.exc.GitCommandError, ValueError):
+            return None
+        return parents[0].hexsha if parents else None
     
     def _create_head_backup(self) -> None:
         """Create automatic backup tag pointing to current HEAD before making changes."""
         try:
             # Create a tag with timestamp pointing to current HEAD
-            timestamp = subprocess.run(
-                ["date", "+%Y%m%d_%H%M%S"],
-                capture_output=True,
-                text=True
-            ).stdout.strip()
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
             tag_name = f"fastfixupfinder_backup_{timestamp}"
 
-            # Create tag pointing to current HEAD
-            self.repo.git.tag(tag_name)
+            # Create tag pointing to current HEAD; the ref is written in-process, without running git
+            git.Reference.create(self.repo, f"refs/tags/{tag_name}", self.repo.head.commit.hexsha)
             print(f"🛡️  Safety backup created: {tag_name}")
             print(f"   To restore if needed: git reset --hard {tag_name}")
 
@@ -558,8 +546,9 @@ class FixupCreator:
                 self.repo.git.stash("apply", backup_name)
             else:
                 # List available backups
-                stashes = self.repo.git.stash("list").split('\n')
-                fastfixup_stashes = [s for s in stashes if 'fastfixupfinder_backup' in s]
+                # Let git do the filtering rather than listing every stash
+                stashes = self.repo.git.stash("list", "--fixed-strings", "--grep=fastfixupfinder_backup")
+                fastfixup_stashes = [s for s in stashes.split('\n') if s.strip()]
                 
                 if not fastfixup_stashes:
                     print(Colors.colorize("🔍 No fastfixupfinder backups found", Colors.YELLOW))
@@ -574,7 +563,7 @@ class FixupCreator:
                 
                 prompt = Colors.colorize("🔄 Enter backup number to restore ", Colors.BRIGHT_CYAN, bold=True)
                 options = Colors.colorize("(or 'cancel')", Colors.DIM)
-                choice = input(f"{prompt}{options}: ")
+                choice = _read_line(f"{prompt}{options}: ")
                 if choice.lower() == 'cancel':
                     print(Colors.colorize("❌ Restore cancelled.", Colors.YELLOW))
                     return False
@@ -609,75 +598,58 @@ class FixupCreator:
             show_diff: Whether to show diff context for each target
             context_lines: Number of context lines to show around changes in diff
         """
-        # Get all fixup targets first
-        all_fixup_targets = self.analyzer.find_fixup_targets()  # Uses SMART_DEFAULT
+        # Get fixup targets, keeping only those by organization authors if a pattern is set
+        fixup_targets = self.analyzer.find_fixup_targets(filter_author_email=self.org_email_pattern)  # Uses SMART_DEFAULT
         
-        # Apply organization filtering if specified
-        if self.org_email_pattern:
-            fixup_targets = self.analyzer.filter_targets_by_organization(all_fixup_targets, self.org_email_pattern)
-            if not fixup_targets:
-                if all_fixup_targets:
-                    print(Colors.colorize(f"🔍 Found {len(all_fixup_targets)} fixup targets, but none match organization email pattern '{self.org_email_pattern}'.", Colors.YELLOW))
-                else:
-                    print(Colors.colorize("🔍 No fixup targets found.", Colors.YELLOW))
-                    print(Colors.colorize("   Working directory is clean or no blame information available.", Colors.DIM))
-                return
-        else:
-            fixup_targets = all_fixup_targets
-            if not fixup_targets:
-                print(Colors.colorize("🔍 No fixup targets found.", Colors.YELLOW))
-                print(Colors.colorize("   Working directory is clean or no blame information available.", Colors.DIM))
-                return
+        if not fixup_targets:
+            self._report_no_targets()
+            return
         
         if show_diff:
             # Show diff table format
             self._show_diff_table(fixup_targets, context_lines)
         else:
-            # Show regular format
+            # Show regular format, buffered and written in one go
+            buf = io.StringIO()
             # Header with emoji and color
             count_text = Colors.colorize(str(len(fixup_targets)), Colors.BRIGHT_GREEN, bold=True)
-            print(f"🎯 Found {count_text} potential fixup target{'s' if len(fixup_targets) != 1 else ''}:")
-            print()
+            print(f"🎯 Found {count_text} potential fixup target{'s' if len(fixup_targets) != 1 else ''}:", file=buf)
+            print(file=buf)
             
             for i, target in enumerate(fixup_targets, 1):
-                short_hash = Colors.colorize(target.commit_hash[:8], Colors.BRIGHT_CYAN, bold=True)
+                short_hash = Colors.colorize(target.short_hash, Colors.BRIGHT_CYAN, bold=True)
                 commit_msg = Colors.colorize(target.commit_message, Colors.WHITE, bold=True)
-                print(f"• {short_hash}: {commit_msg}")
+                print(f"• {short_hash}: {commit_msg}", file=buf)
                 
                 # Author in dim color
                 author_text = Colors.colorize(f"  👤 Author: {target.author}", Colors.DIM)
-                print(author_text)
+                print(author_text, file=buf)
                 
                 # Files with emoji and count
-                files_list = ', '.join(sorted(target.files))
+                files_list = ', '.join(target.files)
                 file_count = len(target.files)
                 files_text = Colors.colorize(f"  📁 File{'s' if file_count != 1 else ''}: {files_list}", Colors.BLUE)
-                print(files_text)
+                print(files_text, file=buf)
                 
                 # Changed lines with emoji
                 lines_count = Colors.colorize(str(len(target.changed_lines)), Colors.BRIGHT_YELLOW)
-                print(f"  📝 Changed lines: {lines_count}")
+                print(f"  📝 Changed lines: {lines_count}", file=buf)
                 
                 # Show some example changes with colored symbols
                 if target.changed_lines:
-                    print(Colors.colorize("  📋 Sample changes:", Colors.MAGENTA))
+                    print(Colors.colorize("  📋 Sample changes:", Colors.MAGENTA), file=buf)
                     for line in target.changed_lines[:3]:  # Show first 3 changes
-                        change_type = line.change_type
-                        if change_type == "added":
-                            symbol = Colors.colorize("+", Colors.BRIGHT_GREEN, bold=True)
-                        elif change_type == "deleted":
-                            symbol = Colors.colorize("-", Colors.BRIGHT_RED, bold=True)
-                        else:  # modified
-                            symbol = Colors.colorize("~", Colors.BRIGHT_YELLOW, bold=True)
+                        symbol = _CHANGE_SYMBOLS.get(line.change_type, _CHANGE_SYMBOLS["modified"])
                         
                         file_line = Colors.colorize(f"{line.file_path}:{line.line_number}", Colors.CYAN)
-                        print(f"    {symbol} {file_line}")
+                        print(f"    {symbol} {file_line}", file=buf)
                     
                     if len(target.changed_lines) > 3:
                         more_text = Colors.colorize(f"    ... and {len(target.changed_lines) - 3} more", Colors.DIM)
-                        print(more_text)
+                        print(more_text, file=buf)
                 
-                print()
+                print(file=buf)
+            print(buf.getvalue(), end="")
     
     def _show_diff_table(self, fixup_targets: List[FixupTarget], context_lines: int = 4) -> None:
         """Show fixup targets in a table format with diff context."""
@@ -687,24 +659,9 @@ class FixupCreator:
         # Get terminal width for diff column truncation
         terminal_width = shutil.get_terminal_size().columns
         
-        # First pass: collect all data to analyze content lengths
-        table_data = []
-        max_subject_len = 0
-        
-        for i, target in enumerate(fixup_targets, 1):
-            # Get commit subject (first line only) - don't truncate yet
-            subject = target.commit_message.split('\n')[0]
-            max_subject_len = max(max_subject_len, len(subject))
-            
-            # Generate compact diff for this target (with generous width for now)
-            diff_content = self._get_compact_diff(target, 200, context_lines)
-            
-            table_data.append([
-                str(i),
-                target.commit_hash[:8],
-                subject,
-                diff_content
-            ])
+        # Commit subjects (first line only) decide the column split; diffs are built afterwards
+        subjects = [target.commit_message.split('\n', 1)[0] for target in fixup_targets]
+        max_subject_len = max(len(subject) for subject in subjects)
         
         # Calculate dynamic column widths based on content and terminal width
         index_width = max(3, len(str(len(fixup_targets))))  # Width needed for index numbers
@@ -724,14 +681,18 @@ class FixupCreator:
         subject_width = optimal_subject
         diff_width = available_space - subject_width
         
-        # Second pass: apply truncation with calculated widths
-        for i, row in enumerate(table_data):
-            if len(row[2]) > subject_width:
-                table_data[i][2] = row[2][:subject_width-3] + "..."
+        # Truncate subjects and generate each diff once at the final width
+        table_data = []
+        for i, (target, subject) in enumerate(zip(fixup_targets, subjects), 1):
+            if len(subject) > subject_width:
+                subject = subject[:subject_width-3] + "..."
             
-            # Regenerate diff with proper width
-            target = fixup_targets[i]
-            table_data[i][3] = self._get_compact_diff(target, diff_width, context_lines)
+            table_data.append([
+                str(i),
+                target.short_hash,
+                subject,
+                self._get_compact_diff(target, diff_width, context_lines)
+            ])
         
         # Create colored headers
         headers = [
@@ -746,15 +707,9 @@ class FixupCreator:
         print(f"🎯 Found {count_text} potential fixup target{'s' if len(fixup_targets) != 1 else ''}:")
         print()
         
-        # Print table with dynamic column width limits based on content
-        max_col_widths = [index_width, sha_width, subject_width, diff_width]
-        
-        # Multi-line diff content is now properly handled by tabulate with disable_numparse=True
-        
-        # Enable proper multi-line cell handling - remove maxcolwidths to preserve newlines
-        table_output = tabulate(table_data, headers=headers, tablefmt="fancy_grid", stralign="left", 
-                               disable_numparse=True)
-        print(table_output)
+        # Multi-line diff cells keep their newlines; each line is padded to the column width
+        print(format_grid_table(table_data, headers))
+        self._file_lines_cache.clear()
     
     def _get_compact_diff(self, target: FixupTarget, max_width: int, context_lines: int = 4) -> str:
         """Generate a compact diff representation for table display with context lines."""
@@ -762,29 +717,25 @@ class FixupCreator:
         
         
         # Use the changed lines that are already part of this target
-        target_changes = target.changed_lines
-        
-        if not target_changes:
+        if not target.changed_lines:
             return "No changes"
         
-        # Group changes by file
-        by_file = {}
-        for change in target_changes:
-            if change.file_path not in by_file:
-                by_file[change.file_path] = []
-            by_file[change.file_path].append(change)
-        
         # Generate compact diff representation with context
         seen_lines = set()  # Track already seen diff lines to avoid duplicates
+        append = diff_lines.append
+        available_for_content = max_width - 8  # 3 for line number + 5 for symbols/padding
         
-        for file_path, changes in sorted(by_file.items()):
+        for file_path, changes in sorted(target.lines_by_file.items()):
             file_name = Path(file_path).name
             
-            # Read current file content for context
+            # Read current file content for context, once per file for all targets touching it
             try:
-                full_path = self.repo_path / file_path
-                with open(full_path, 'r', encoding='utf-8', errors='replace') as f:
-                    file_lines = f.readlines()
+                full_path = str(self.repo_path / file_path)
+                file_lines = self._file_lines_cache.get(full_path)
+                if file_lines is None:
+                    # Kept as bytes: only the few lines around the changes are ever decoded
+                    with open(full_path, 'rb') as f:
+                        file_lines = self._file_lines_cache[full_path] = f.read().splitlines()
             except (FileNotFoundError, UnicodeDecodeError) as e:
                 # Fallback to simple format if file can't be read
                 unique_changes = []
@@ -795,14 +746,13 @@ class FixupCreator:
                         unique_changes.append(change)
                 
                 for change in unique_changes[:2]:  # Limit to 2 when no context
-                    symbol = "+" if change.change_type == "added" else "-" if change.change_type == "deleted" else "~"
-                    symbol = Colors.colorize(symbol, Colors.BRIGHT_GREEN if change.change_type == "added" else Colors.BRIGHT_RED if change.change_type == "deleted" else Colors.BRIGHT_YELLOW, bold=True)
+                    symbol = _CHANGE_SYMBOLS.get(change.change_type, _CHANGE_SYMBOLS["modified"])
                     line_ref = Colors.colorize(f"{file_name}:{change.line_number}", Colors.CYAN)
                     content = change.content.strip()
-                    available_for_content = max_width - len(f"{file_name}:{change.line_number} ") - 5
-                    if len(content) > available_for_content:
-                        content = content[:available_for_content-3] + "..."
-                    diff_lines.append(f"{symbol} {line_ref} {content}")
+                    available = max_width - len(f"{file_name}:{change.line_number} ") - 5
+                    if len(content) > available:
+                        content = content[:available-3] + "..."
+                    append(f"{symbol} {line_ref} {content}")
                 continue
             
             # Deduplicate changes
@@ -815,57 +765,47 @@ class FixupCreator:
             
             # Show filename header once and build context diff for all changes
             if unique_changes:
-                # Build compact diff block
-                diff_block = []
-                
-                # Add filename header as first line of diff block  
-                file_header = Colors.colorize(file_name, Colors.BRIGHT_BLUE, bold=True)
-                diff_block.append(file_header)
-                
-                # Get all line numbers that have changes
-                changed_line_numbers = {change.line_number for change in unique_changes}
+                # Filename header as first line of the file's diff block
+                append(Colors.colorize(file_name, Colors.BRIGHT_BLUE, bold=True))
                 
-                # Calculate the range to show all changes with context
-                all_line_nums = [change.line_number for change in unique_changes]
-                min_line = min(all_line_nums)
-                max_line = max(all_line_nums)
+                # Symbol for each changed line number (the first change listed for a line wins)
+                symbol_by_line = {}
+                for change in unique_changes:
+                    symbol_by_line.setdefault(
+                        change.line_number, _CHANGE_SYMBOLS.get(change.change_type, _CHANGE_SYMBOLS["modified"]))
                 
-                # Expand context around the range
-                start_line = max(0, min_line - 1 - context_lines)
-                end_line = min(len(file_lines), max_line - 1 + context_lines + 1)
+                # One context block per group of nearby changes; changes whose context
+                # would not meet start a new block instead of showing the lines in between
+                groups = []
+                for line_number in sorted(symbol_by_line):
+                    if groups and line_number - groups[-1][1] <= 2 * context_lines + 1:
+                        groups[-1][1] = line_number
+                    else:
+                        groups.append([line_number, line_number])
                 
-                # Build context lines with all changes highlighted
-                for i in range(start_line, end_line):
-                    current_line = file_lines[i].rstrip()
-                    line_number = i + 1
-                    
-                    # Determine if this is a changed line and what type
-                    symbol = " "  # Default context line
-                    if line_number in changed_line_numbers:
-                        # Find the change type for this line
-                        for change in unique_changes:
-                            if change.line_number == line_number:
-                                if change.change_type == "added":
-                                    symbol = Colors.colorize("+", Colors.BRIGHT_GREEN, bold=True)
-                                elif change.change_type == "deleted":
-                                    symbol = Colors.colorize("-", Colors.BRIGHT_RED, bold=True)
-                                else:  # modified
-                                    symbol = Colors.colorize("~", Colors.BRIGHT_YELLOW, bold=True)
-                                break
+                for group_index, (min_line, max_line) in enumerate(groups):
+                    if group_index:
+                        append(_DIFF_GAP)
                     
-                    line_ref = Colors.colorize(f"{line_number:>3}", Colors.CYAN)
+                    # Expand context around the group
+                    start_line = max(0, min_line - 1 - context_lines)
+                    end_line = min(len(file_lines), max_line - 1 + context_lines + 1)
                     
-                    # Truncate content to fit in available space
-                    available_for_content = max_width - 8  # 3 for line number + 5 for symbols/padding
-                    if len(current_line) > available_for_content:
-                        content = current_line[:available_for_content-3] + "..."
-                    else:
-                        content = current_line
-                    
-                    diff_block.append(f"{symbol} {line_ref} │ {content}")
-                
-                # Add this file's diff block to main diff lines
-                diff_lines.extend(diff_block)
+                    # Build context lines with all changes highlighted
+                    for i in range(start_line, end_line):
+                        current_line = file_lines[i].decode('utf-8', 'replace').rstrip()
+                        line_number = i + 1
+                        
+                        # Changed lines get their change type symbol, context lines a blank
+                        symbol = symbol_by_line.get(line_number, " ")
+                        
+                        line_ref = Colors.colorize(f"{line_number:>3}", Colors.CYAN)
+                        
+                        # Truncate content to fit in available space
+                        if len(current_line) > available_for_content:
+                            current_line = current_line[:available_for_content-3] + "..."
+                        
+                        append(f"{symbol} {line_ref} │ {current_line}")
         
         # Join all diff lines - show full context without truncation
         result = "\n".join(diff_lines)
@@ -880,30 +820,19 @@ class FixupCreator:
     
     def status_oneline(self) -> None:
         """Show current status of potential fixup targets in compact one-line format."""
-        # Get all fixup targets first
-        all_fixup_targets = self.analyzer.find_fixup_targets()  # Uses SMART_DEFAULT
+        # Get fixup targets, keeping only those by organization authors if a pattern is set
+        fixup_targets = self.analyzer.find_fixup_targets(filter_author_email=self.org_email_pattern)  # Uses SMART_DEFAULT
         
-        # Apply organization filtering if specified
-        if self.org_email_pattern:
-            fixup_targets = self.analyzer.filter_targets_by_organization(all_fixup_targets, self.org_email_pattern)
-            if not fixup_targets:
-                if all_fixup_targets:
-                    print(Colors.colorize(f"Found {len(all_fixup_targets)} fixup targets, but none match organization email pattern '{self.org_email_pattern}'.", Colors.YELLOW))
-                else:
-                    print(Colors.colorize("No fixup targets found.", Colors.YELLOW))
-                return
-        else:
-            fixup_targets = all_fixup_targets
-            if not fixup_targets:
-                print(Colors.colorize("No fixup targets found.", Colors.YELLOW))
-                return
+        if not fixup_targets:
+            self._report_no_targets(oneline=True)
+            return
         
         # Simple header for oneline mode
         count_text = Colors.colorize(str(len(fixup_targets)), Colors.BRIGHT_GREEN, bold=True)
         print(f"Found {count_text} fixup targets:")
         
         for target in fixup_targets:
-            short_hash = Colors.colorize(target.commit_hash[:8], Colors.BRIGHT_CYAN, bold=True)
+            short_hash = Colors.colorize(target.short_hash, Colors.BRIGHT_CYAN, bold=True)
             files_count = Colors.colorize(str(len(target.files)), Colors.BRIGHT_BLUE)
             lines_count = Colors.colorize(str(len(target.changed_lines)), Colors.BRIGHT_YELLOW)
             message = target.commit_message[:60] + "..." if len(target.commit_message) > 60 else target.commit_message
@@ -937,145 +866,109 @@ class FixupCreator:
         print()
         
         # Print table with git commands
-        table_output = tabulate(table_data, headers=headers, tablefmt="fancy_grid", stralign="left", 
-                               disable_numparse=True)
-        print(table_output)
+        print(format_grid_table(table_data, headers))
         
         # Add note about line-level staging
-        note = Colors.colorize("ℹ️  Using automated git add --patch for precise line-level staging", Colors.CYAN)
+        note = Colors.colorize("ℹ️  Using git apply --cached with zero-context hunks for precise line-level staging", Colors.CYAN)
         print()
         print(note)
     
-    def _stage_lines_for_target(self, target: FixupTarget, file_path: str, commands: list) -> bool:
-        """Stage only the specific lines that belong to this fixup target using git add --patch.
-        
-        Args:
-            target: The fixup target containing the lines to stage
-            file_path: Path to the file to stage from
-            commands: List to append git commands to
-            
-        Returns:
-            bool: True if staging was successful, False otherwise
-        """
-        import subprocess
-        import tempfile
-        
-        # Get the line numbers that belong to this target
-        target_lines = set()
-        for changed_line in target.changed_lines:
-            if changed_line.file_path == file_path:
-                target_lines.add(changed_line.line_number)
-        
-        if not target_lines:
-            return False
-        
-        try:
-            # First, get the current diff for this file to understand the hunks
-            diff_result = subprocess.run(
-                ['git', 'diff', '--no-color', file_path],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            if not diff_result.stdout.strip():
-                return False  # No changes to stage
-            
-            # Parse the diff to understand which hunks contain our target lines
-            hunks_to_accept = self._parse_diff_for_target_lines(diff_result.stdout, target_lines)
-            
-            if not hunks_to_accept:
-                return False
-            
-            # Create automated responses for git add --patch
-            # 'y' = yes to stage this hunk, 'n' = no to skip this hunk
-            responses = []
-            for i, accept_hunk in enumerate(hunks_to_accept):
-                if accept_hunk:
-                    responses.append('y')
-                else:
-                    responses.append('n')
-            
-            # Add final 'q' to quit the interactive session
-            responses.append('q')
-            response_input = '\n'.join(responses) + '\n'
-            
-            # Run git add --patch with automated responses
-            patch_result = subprocess.run(
-                ['git', 'add', '--patch', file_path],
-                cwd=self.repo_path,
-                input=response_input,
-                text=True,
-                capture_output=True
-            )
-            
-            if patch_result.returncode == 0:
-                # Record the command that was executed
-                hunk_info = f"hunks {[i+1 for i, accept in enumerate(hunks_to_accept) if accept]}"
-                commands.append(f"git add --patch {file_path}  # accepted {hunk_info}")
-                return True
-            else:
-                return False
-                
-        except subprocess.CalledProcessError as e:
-            print(Colors.colorize(f"⚠️  Error staging {file_path}: {e}", Colors.YELLOW))
-            return False
-    
-    def _parse_diff_for_target_lines(self, diff_output: str, target_lines: set) -> list:
-        """Parse git diff output to determine which hunks contain target lines.
-        
-        Args:
-            diff_output: Output from git diff
-            target_lines: Set of line numbers that belong to the target
-            
-        Returns:
-            list: Boolean list indicating which hunks to accept
+    def _read_worktree_hunks(self) -> Dict[str, _FileDiff]:
+        """Read every unstaged change once as zero-context hunks, keyed by file path.
+
+        Files that are new, deleted, binary or mode-only changes carry no hunks
+        and are left out; they cannot be fixups of an existing line anyway.
         """
-        lines = diff_output.split('\n')
-        hunks_to_accept = []
-        current_hunk_has_target = False
-        in_hunk = False
-        
-        for line in lines:
-            # Start of new hunk
-            if line.startswith('@@'):
-                # If we were in a previous hunk, record the decision
-                if in_hunk:
-                    hunks_to_accept.append(current_hunk_has_target)
-                
-                # Parse hunk header to get line numbers
-                # Format: @@ -old_start,old_count +new_start,new_count @@
-                parts = line.split()
-                if len(parts) >= 3:
-                    new_range = parts[2]  # +new_start,new_count
-                    if ',' in new_range:
-                        new_start = int(new_range.split(',')[0][1:])  # Remove '+'
-                    else:
-                        new_start = int(new_range[1:])  # Remove '+'
-                    
-                    # Check if any target lines fall in this hunk range
-                    # This is a simplified check - we'll refine based on actual diff content
-                    current_hunk_has_target = any(
-                        abs(line_num - new_start) < 10  # rough proximity check
-                        for line_num in target_lines
+        # Explicit prefixes, so diff.noprefix or diff.mnemonicPrefix can't change the headers
+        diff_cmd = ['git', '--no-pager', 'diff', '-U0', '--no-color', '--no-ext-diff', '--no-renames',
+                    '--src-prefix=a/', '--dst-prefix=b/']
+        # Parsed as it streams in, so the whole diff is never held as one string
+        with subprocess.Popen(diff_cmd, cwd=self.repo_path, env=_GIT_ENV, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL) as proc:
+            file_diffs = self._parse_worktree_hunks(proc.stdout)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, diff_cmd)
+        return file_diffs
+
+    @staticmethod
+    def _parse_worktree_hunks(diff_stream) -> Dict[str, _FileDiff]:
+        """Parse `git diff -U0` output, given as an iterable of byte lines."""
+        file_diffs = {}
+        current = None
+        hunk = None
+        for raw_line in diff_stream:
+            # surrogateescape round-trips non-UTF-8 content back into the patch untouched
+            line = raw_line.decode('utf-8', 'surrogateescape').rstrip('\n')
+            if line.startswith('diff --git '):
+                current = _FileDiff(header=[line])
+                hunk = None
+            elif current is None:
+                continue
+            elif hunk is None and not line.startswith('@@'):
+                # Extended header lines; only '--- a/' and '+++ b/' are kept
+                if line.startswith('--- ') and _header_path(line[4:]).startswith('a/'):
+                    current.header.append(line)
+                elif line.startswith('+++ ') and len(current.header) == 2:
+                    path = _header_path(line[4:])
+                    if path.startswith('b/'):
+                        current.header.append(line)
+                        file_diffs[path[2:]] = current
+            elif line.startswith('@@'):
+                match = DIFF_HUNK_RE.match(line)
+                if match and len(current.header) == 3:
+                    hunk = _DiffHunk(
+                        old_start=int(match.group(1)),
+                        old_count=int(match.group(2) or 1),
+                        new_start=int(match.group(3)),
+                        new_count=int(match.group(4) or 1),
+                        body=[]
                     )
-                else:
-                    current_hunk_has_target = False
-                
-                in_hunk = True
-            
-            # More precise check: if we see a specific line change that matches our targets
-            elif line.startswith(('+', '-', ' ')) and in_hunk:
-                # This is a rough implementation - in practice, we'd need more sophisticated
-                # line tracking to match exact line numbers from our analysis
-                pass
-        
-        # Don't forget the last hunk
-        if in_hunk:
-            hunks_to_accept.append(current_hunk_has_target)
+                    current.hunks.append(hunk)
+            elif line[:1] in ('+', '-', '\\'):
+                hunk.body.append(line)
+
+        return file_diffs
+
+    def _claim_target_hunks(self, target: FixupTarget, file_diffs: Dict[str, _FileDiff],
+                            claimed: Set[_DiffHunk]) -> List[_DiffHunk]:
+        """Return the hunks, not yet claimed by an earlier target, that contain this target's lines."""
+        # Split the target's line numbers by file and diff side in a single pass
+        old_lines = defaultdict(set)
+        new_lines = defaultdict(set)
+        for cl in target.changed_lines:
+            (new_lines if cl.change_type == 'added' else old_lines)[cl.file_path].add(cl.line_number)
+
+        target_hunks = []
+        for file_path in target.files:
+            file_diff = file_diffs.get(file_path)
+            if file_diff is None:
+                continue
+            file_old, file_new = old_lines.get(file_path, set()), new_lines.get(file_path, set())
+            target_hunks.extend(h for h in file_diff.hunks
+                                if h not in claimed and h.contains(file_old, file_new))
+        return target_hunks
+
+    def _build_partial_patch(self, file_diffs: Dict[str, _FileDiff], hunks: Set[_DiffHunk]) -> bytes:
+        """Build a patch against the index holding only the given hunks.
 
-        return hunks_to_accept
+        With zero context the new-side start of each hunk depends on which
+        earlier hunks of the file are included, so it is recomputed here.
+        """
+        patch_lines = []
+        for file_diff in file_diffs.values():
+            selected = [h for h in file_diff.hunks if h in hunks]
+            if not selected:
+                continue
+
+            patch_lines.extend(file_diff.header)
+            shift = 0  # Line delta of the hunks already emitted for this file
+            for hunk in selected:
+                new_start = hunk.preceding_line + shift + (1 if hunk.new_count else 0)
+                patch_lines.append(f"@@ -{hunk.old_start},{hunk.old_count} +{new_start},{hunk.new_count} @@")
+                patch_lines.extend(hunk.body)
+                shift += hunk.new_count - hunk.old_count
+
+        return ('\n'.join(patch_lines) + '\n').encode('utf-8', 'surrogateescape')
 
     def _ask_commit_type(self) -> str:
         """Ask user whether to create fixup or squash commit.
@@ -1084,7 +977,7 @@ class FixupCreator:
             'fixup' or 'squash'
         """
         while True:
-            response = input("🔧 Commit type [f]ixup or [s]quash?: ").strip().lower()
+            response = _read_line("🔧 Commit type [f]ixup or [s]quash?: ").strip().lower()
             if response == 'f' or response == 'fixup':
                 return 'fixup'
             elif response == 's' or response == 'squash':
@@ -1101,9 +994,6 @@ class FixupCreator:
         Returns:
             Edited message (without 'squash!' prefix)
         """
-        import tempfile
-        import os
-
         try:
             # Create temporary file with prefilled message
             with tempfile.NamedTemporaryFile(
@@ -1148,38 +1038,21 @@ class FixupCreator:
             # Fallback to inline
             print(f"\n📝 Edit message (or press Enter to keep original):")
             print(f"   Original: {prefill_message}")
-            edited = input("> ").strip()
+            edited = _read_line("> ").strip()
             return edited if edited else prefill_message
 
-    def _display_targets_compact(
-        self,
-        targets: List[FixupTarget],
-        selected_indices: Optional[set] = None
-    ):
-        """Display targets in a compact numbered list format.
-
-        Args:
-            targets: List of fixup targets
-            selected_indices: Set of selected indices (1-based)
-        """
+    def _format_compact_rows(self, targets: List[FixupTarget]) -> List[str]:
+        """Format each target as a numbered one-line summary, without its checkbox."""
+        rows = []
         for i, target in enumerate(targets, 1):
-            # Checkbox
-            if selected_indices is not None:
-                if i in selected_indices:
-                    checkbox = Colors.colorize("[✓]", Colors.BRIGHT_GREEN, bold=True)
-                else:
-                    checkbox = Colors.colorize("[ ]", Colors.DIM)
-            else:
-                checkbox = "   "
-
             # Number
             number = Colors.colorize(f"{i}.", Colors.BRIGHT_MAGENTA, bold=True)
 
             # SHA
-            sha = Colors.colorize(target.commit_hash[:8], Colors.BRIGHT_CYAN, bold=True)
+            sha = Colors.colorize(target.short_hash, Colors.BRIGHT_CYAN, bold=True)
 
             # Truncate message to fit nicely
-            clean_message = ' '.join(target.commit_message.split())
+            clean_message = target.one_line_message
             max_msg_len = 50
             message = clean_message[:max_msg_len] + "..." if len(clean_message) > max_msg_len else clean_message
 
@@ -1190,22 +1063,50 @@ class FixupCreator:
             line_str = "line" if num_lines == 1 else "lines"
             summary = Colors.colorize(f"({num_files} {file_str}, {num_lines} {line_str})", Colors.BRIGHT_BLUE)
 
-            # Print the line
-            print(f"  {checkbox} {number} {sha}  {message} {summary}")
+            rows.append(f"{number} {sha}  {message} {summary}")
+        return rows
+
+    def _render_targets_compact(
+        self,
+        targets: List[FixupTarget],
+        selected_indices: Optional[set] = None,
+        rows: Optional[List[str]] = None
+    ) -> str:
+        """Render targets in a compact numbered list format.
+
+        Args:
+            targets: List of fixup targets
+            selected_indices: Set of selected indices (1-based)
+            rows: Rows from _format_compact_rows, to skip formatting them again on redraws
+        """
+        if rows is None:
+            rows = self._format_compact_rows(targets)
+
+        lines = []
+        for i, row in enumerate(rows, 1):
+            # Checkbox, the only part that changes between redraws
+            if selected_indices is None:
+                checkbox = "   "
+            elif i in selected_indices:
+                checkbox = _CHECKBOX_ON
+            else:
+                checkbox = _CHECKBOX_OFF
+            lines.append(f"  {checkbox} {row}")
+        return "\n".join(lines)
 
     def _show_target_info(self, target: FixupTarget, index: int):
         """Show detailed information about a target."""
         print()
-        print(Colors.colorize("━" * 80, Colors.CYAN))
+        print(_SEPARATOR)
         print(Colors.colorize(f"Target {index}: {target.commit_hash}", Colors.WHITE, bold=True))
-        print(Colors.colorize("━" * 80, Colors.CYAN))
+        print(_SEPARATOR)
         print(f"\n{Colors.colorize('Commit Message:', Colors.WHITE, bold=True)}")
         print(f"  {target.commit_message}")
         print(f"\n{Colors.colorize('Author:', Colors.WHITE, bold=True)}")
         print(f"  {target.author}")
         print(f"\n{Colors.colorize('Files Changed:', Colors.WHITE, bold=True)}")
-        for file_path in sorted(target.files):
-            file_lines = [cl for cl in target.changed_lines if cl.file_path == file_path]
+        for file_path in target.files:
+            file_lines = target.lines_by_file.get(file_path, [])
             print(f"  📁 {Colors.colorize(file_path, Colors.BRIGHT_BLUE)} ({len(file_lines)} lines)")
             for cl in file_lines[:5]:  # Show first 5 lines
                 change_symbol = {"added": "+", "modified": "~", "deleted": "-"}.get(cl.change_type, "?")
@@ -1213,7 +1114,7 @@ class FixupCreator:
                 print(f"     {Colors.colorize(change_symbol, symbol_color)} L{cl.line_number}: {cl.content[:60]}...")
             if len(file_lines) > 5:
                 print(f"     ... and {len(file_lines) - 5} more lines")
-        print(Colors.colorize("━" * 80, Colors.CYAN))
+        print(_SEPARATOR)
         print()
 
     def _parse_selection(self, response: str, max_index: int) -> set:
@@ -1229,31 +1130,31 @@ class FixupCreator:
             Set of selected indices (1-based)
         """
         selected = set()
+        valid = range(1, max_index + 1)  # Constant-time membership tests
         parts = response.replace(' ', '').split(',')
 
         for part in parts:
-            if '-' in part:
-                # Range: 1-3
-                try:
-                    start, end = part.split('-')
-                    start_idx = int(start)
-                    end_idx = int(end)
-                    if 1 <= start_idx <= max_index and 1 <= end_idx <= max_index:
-                        selected.update(range(start_idx, end_idx + 1))
-                    else:
-                        print(Colors.colorize(f"⚠️  Invalid range: {part}", Colors.YELLOW))
-                except ValueError:
+            match = _SELECTION_PART_RE.fullmatch(part)
+            if match is None:
+                if '-' in part:
                     print(Colors.colorize(f"⚠️  Invalid range format: {part}", Colors.YELLOW))
+                else:
+                    print(Colors.colorize(f"⚠️  Invalid number: {part}", Colors.YELLOW))
+            elif match.group(2) is not None:
+                # Range: 1-3
+                start_idx = int(match.group(1))
+                end_idx = int(match.group(2))
+                if start_idx in valid and end_idx in valid:
+                    selected.update(range(start_idx, end_idx + 1))
+                else:
+                    print(Colors.colorize(f"⚠️  Invalid range: {part}", Colors.YELLOW))
             else:
                 # Single number
-                try:
-                    idx = int(part)
-                    if 1 <= idx <= max_index:
-                        selected.add(idx)
-                    else:
-                        print(Colors.colorize(f"⚠️  Invalid index: {idx}", Colors.YELLOW))
-                except ValueError:
-                    print(Colors.colorize(f"⚠️  Invalid number: {part}", Colors.YELLOW))
+                idx = int(match.group(1))
+                if idx in valid:
+                    selected.add(idx)
+                else:
+                    print(Colors.colorize(f"⚠️  Invalid index: {idx}", Colors.YELLOW))
 
         return selected
 
@@ -1267,55 +1168,52 @@ class FixupCreator:
             List of selected targets
         """
         selected = set()
+        rows = self._format_compact_rows(targets)
 
         while True:
-            # Display header with selection count
-            print()
-            print(Colors.colorize("━" * 80, Colors.CYAN))
+            # Header with selection count
             if selected:
                 header = f"🎯 Target Selection ({len(selected)} of {len(targets)} selected)"
             else:
                 header = "🎯 Target Selection"
-            print(Colors.colorize(header, Colors.WHITE, bold=True))
-            print(Colors.colorize("━" * 80, Colors.CYAN))
-            print()
-
-            # Display targets in compact format
-            self._display_targets_compact(targets, selected_indices=selected)
 
-            # Commands help
-            print()
-            print(Colors.colorize("Commands: 1,3,5 | 1-3 (range) | all | info N | done", Colors.DIM))
+            # The whole screen goes out in one write: header, targets in compact format, commands help
+            print("\n".join([
+                "",
+                _SEPARATOR,
+                Colors.colorize(header, Colors.WHITE, bold=True),
+                _SEPARATOR,
+                "",
+                self._render_targets_compact(targets, selected_indices=selected, rows=rows),
+                "",
+                _SELECTION_HELP,
+            ]))
 
             # Prompt
-            response = input(Colors.colorize("→ ", Colors.BRIGHT_CYAN)).strip()
+            response = _read_line(_SELECTION_PROMPT).strip()
 
             if not response:
                 continue
 
-            if response.lower() == 'done':
-                if selected:
-                    break
-                else:
+            command = _SELECTION_COMMAND_RE.fullmatch(response)
+            if command is not None:
+                keyword = (command.group('cmd') or '').lower()
+                if keyword == 'done':
+                    if selected:
+                        break
                     print(Colors.colorize("⚠️  No targets selected. Please select at least one target.", Colors.YELLOW))
-                    continue
-
-            if response.lower() == 'all':
-                selected = set(range(1, len(targets) + 1))
-                print(Colors.colorize(f"✅ Selected all {len(targets)} targets", Colors.GREEN))
-                continue
-
-            # Check for info command
-            if response.lower().startswith('info '):
-                try:
-                    idx = int(response.split()[1])
+                elif keyword == 'all':
+                    selected = set(range(1, len(targets) + 1))
+                    print(Colors.colorize(f"✅ Selected all {len(targets)} targets", Colors.GREEN))
+                elif command.group('info_idx'):
+                    idx = int(command.group('info_idx'))
                     if 1 <= idx <= len(targets):
                         self._show_target_info(targets[idx - 1], idx)
                         # Wait for user to press enter before showing list again
-                        input(Colors.colorize("\n[Press Enter to continue]", Colors.DIM))
+                        _read_line(_CONTINUE_PROMPT)
                     else:
                         print(Colors.colorize(f"⚠️  Invalid index: {idx}", Colors.YELLOW))
-                except (ValueError, IndexError):
+                else:
                     print(Colors.colorize("⚠️  Usage: info <number>", Colors.YELLOW))
                 continue
 
@@ -1327,6 +1225,32 @@ class FixupCreator:
 
         return [targets[i - 1] for i in sorted(selected)]
 
+    def _find_ancestor_by_subject(self, commit: git.Commit, subject: str) -> Optional[git.Commit]:
+        """Find the nearest ancestor of commit whose subject is exactly subject.
+
+        git log does the message search; its output is read only until the
+        first exact subject match, at which point the walk is stopped. The
+        first-parent line is searched first, since fixups are nearly always
+        made on the branch of their target; merged-in history only after that.
+        """
+        if not commit.parents:
+            return None
+        for walk_options in (['--first-parent'], []):
+            cmd = ['git', '--no-pager', 'log', *walk_options, '--format=%H %s', '--fixed-strings',
+                   f'--grep={subject}', commit.parents[0].hexsha]
+            with subprocess.Popen(cmd, cwd=self.repo_path, env=_GIT_ENV, stdout=subprocess.PIPE,
+                                  stderr=subprocess.DEVNULL) as proc:
+                try:
+                    for raw_line in proc.stdout:
+                        # --grep also matches message bodies, so compare the subject itself;
+                        # git already trims %s, so it needs no stripping here
+                        sha, _, found_subject = raw_line.decode('utf-8', 'replace').rstrip('\n').partition(' ')
+                        if found_subject == subject:
+                            return self.repo.commit(sha)
+                finally:
+                    proc.kill()
+        return None
+
     def resquash_commit(self, commit_sha: str) -> bool:
         """Convert a fixup! commit to a squash! commit with message editing.
 
@@ -1336,8 +1260,6 @@ class FixupCreator:
         Returns:
             True if successful, False otherwise
         """
-        import os
-
         try:
             # Get the commit object
             try:
@@ -1347,28 +1269,28 @@ class FixupCreator:
                 print(Colors.colorize(f"   {e}", Colors.DIM))
                 return False
 
-            commit_message = commit.message.strip()
+            # Only the subject line matters; a long message body is never stripped or scanned
+            subject_line = commit.message.lstrip().split('\n', 1)[0]
 
             # Check if it's a fixup commit
-            if not commit_message.startswith('fixup! '):
+            if not subject_line.startswith('fixup! '):
                 print(Colors.colorize(f"❌ Error: Commit {commit_sha[:8]} is not a fixup! commit", Colors.BRIGHT_RED))
-                print(Colors.colorize(f"   Message: {commit_message[:60]}...", Colors.DIM))
+                print(Colors.colorize(f"   Message: {subject_line[:60]}...", Colors.DIM))
+                return False
+
+            # The commits after the fixup are replayed with git rebase, which refuses to
+            # run over unstaged changes, so check before anything is written
+            if self.repo.is_dirty():
+                print(Colors.colorize("❌ Error: You have uncommitted changes", Colors.BRIGHT_RED))
+                print(Colors.colorize("   Please commit or stash them first", Colors.DIM))
                 return False
 
             # Extract the fixup target message (remove 'fixup! ' prefix)
-            fixup_target_subject = commit_message[7:]  # Remove 'fixup! '
+            fixup_target_subject = subject_line[7:].strip()
 
             # Find the actual target commit by searching for a commit with matching subject
-            target_commit = None
-            target_commit_message = None
-
-            # Search through ancestor commits to find the target
-            for ancestor in self.repo.iter_commits(f'{commit.hexsha}~1', max_count=100):
-                ancestor_subject = ancestor.message.split('\n')[0].strip()
-                if ancestor_subject == fixup_target_subject:
-                    target_commit = ancestor
-                    target_commit_message = ancestor.message.strip()
-                    break
+            target_commit = self._find_ancestor_by_subject(commit, fixup_target_subject)
+            target_commit_message = target_commit.message.strip() if target_commit else None
 
             if not target_commit:
                 # Fallback: use the fixup target subject as the message
@@ -1377,9 +1299,9 @@ class FixupCreator:
                 target_commit_message = fixup_target_subject
 
             print()
-            print(Colors.colorize("━" * 80, Colors.CYAN))
+            print(_SEPARATOR)
             print(Colors.colorize(f"🔄 Converting fixup to squash: {commit_sha[:8]}", Colors.WHITE, bold=True))
-            print(Colors.colorize("━" * 80, Colors.CYAN))
+            print(_SEPARATOR)
             print(f"\nFixup commit: fixup! {fixup_target_subject[:60]}{'...' if len(fixup_target_subject) > 60 else ''}")
             if target_commit:
                 print(f"Target commit: {Colors.colorize(target_commit.hexsha[:8], Colors.BRIGHT_CYAN, bold=True)}")
@@ -1399,8 +1321,8 @@ class FixupCreator:
             print()
 
             # Confirm before making changes
-            confirm = input(Colors.colorize("Convert fixup to squash? [Y/n]: ", Colors.BRIGHT_YELLOW)).strip().lower()
-            if confirm and confirm not in ['y', 'yes']:
+            confirm = _read_line(_RESQUASH_CONFIRM_PROMPT)
+            if confirm.strip()[:4].lower() not in _YES_ANSWERS:
                 print(Colors.colorize("❌ Aborted", Colors.YELLOW))
                 return False
 
@@ -1410,7 +1332,6 @@ class FixupCreator:
             # Create the squash! message format that git rebase understands
             squash_message = f"squash! {edited_message}"
 
-            # Use git filter-repo or commit --amend in a detached HEAD state
             # Save current state
             original_branch = None
             original_head = self.repo.head.commit.hexsha
@@ -1429,75 +1350,55 @@ class FixupCreator:
                     print(Colors.colorize("❌ Cannot rewrite root commit", Colors.BRIGHT_RED))
                     return False
 
-                # Checkout the parent commit
-                self.repo.git.checkout(parent_commit.hexsha)
-
-                # Cherry-pick the fixup commit with the new message
-                try:
-                    self.repo.git.cherry_pick('-n', commit.hexsha)  # -n means --no-commit
-                    self.repo.git.commit('-m', squash_message, '--no-verify', '--author', f'{commit.author.name} <{commit.author.email}>')
-                    new_commit = self.repo.head.commit
-
-                    # Now replay all commits that came after the fixup commit
-                    commits_to_replay = []
-                    for c in self.repo.iter_commits(f'{commit.hexsha}..{original_head}'):
-                        commits_to_replay.insert(0, c)
-
-                    for c in commits_to_replay:
-                        try:
-                            self.repo.git.cherry_pick(c.hexsha)
-                        except Exception as e:
-                            print(Colors.colorize(f"❌ Conflict replaying commit {c.hexsha[:8]}: {e}", Colors.BRIGHT_RED))
-                            print(Colors.colorize("Please resolve conflicts and run: git cherry-pick --continue", Colors.YELLOW))
-                            print(Colors.colorize("Then manually update your branch", Colors.YELLOW))
-                            return False
-
-                    new_head = self.repo.head.commit.hexsha
-
-                    # Update the original branch to point to the new HEAD
-                    if original_branch:
-                        self.repo.git.checkout(original_branch)
-                        self.repo.git.reset('--hard', new_head)
-
-                    new_hash_display = Colors.colorize(new_commit.hexsha[:8], Colors.BRIGHT_GREEN, bold=True)
-                    print()
-                    print(Colors.colorize("━" * 80, Colors.CYAN))
-                    print(f"✅ Successfully converted to squash commit: {new_hash_display}")
-                    print(Colors.colorize("━" * 80, Colors.CYAN))
-                    print()
-                    print(Colors.colorize("The commit message has been rewritten to:", Colors.WHITE, bold=True))
-                    print(f"  {squash_message}")
-                    print()
-                    print(Colors.colorize("Next steps:", Colors.WHITE, bold=True))
-                    print("  Use git rebase -i --autosquash to apply the squash")
-                    print()
-
-                    return True
-
-                except Exception as e:
-                    print(Colors.colorize(f"❌ Error cherry-picking: {e}", Colors.BRIGHT_RED))
-                    # Abort cherry-pick if needed
-                    try:
-                        self.repo.git.cherry_pick('--abort')
-                    except:
-                        pass
-                    raise
-
+                # Same tree and parent as the fixup, only the message changes, so the
+                # new commit is written with commit-tree without checking anything out.
+                # The fixup's authorship is kept; commit-tree ignores commit.gpgSign,
+                # so signing is requested explicitly when the repository wants it
+                author_env = {'GIT_AUTHOR_NAME': commit.author.name, 'GIT_AUTHOR_EMAIL': commit.author.email,
+                              'GIT_AUTHOR_DATE': commit.authored_datetime.isoformat()}
+                sign_args = ['-S'] if self.repo.git.config('--type=bool', '--default=false',
+                                                           'commit.gpgSign').strip() == 'true' else []
+                new_sha = self.repo.git.commit_tree(commit.tree.hexsha, '-p', parent_commit.hexsha, *sign_args,
+                                                    '-m', squash_message, env=author_env).strip()
             except Exception as e:
                 print(Colors.colorize(f"❌ Error rewriting commit: {e}", Colors.BRIGHT_RED))
-                # Restore original state
-                try:
-                    if original_branch:
-                        self.repo.git.checkout(original_branch)
-                    else:
-                        self.repo.git.checkout(original_head)
-                    print(Colors.colorize("Repository restored to original state", Colors.YELLOW))
-                except:
-                    print(Colors.colorize("⚠️  Warning: Could not restore original state", Colors.BRIGHT_RED))
                 return False
 
+            try:
+                if commit.hexsha == original_head:
+                    # Nothing to replay, just point HEAD (and its branch) at the new commit
+                    self.repo.git.update_ref('-m', 'fastfixupfinder: resquash', 'HEAD', new_sha, original_head)
+                else:
+                    # Replay all commits that came after the fixup commit in one rebase,
+                    # which also moves the original branch (or detached HEAD) along
+                    self.repo.git.rebase('--onto', new_sha, commit.hexsha, original_branch or original_head)
+            except Exception as e:
+                print(Colors.colorize(f"❌ Error replaying commits after {commit_sha[:8]}: {e}", Colors.BRIGHT_RED))
+                git_dir = Path(self.repo.git_dir)
+                if (git_dir / 'rebase-merge').is_dir() or (git_dir / 'rebase-apply').is_dir():
+                    print(Colors.colorize("Please resolve conflicts and run: git rebase --continue", Colors.YELLOW))
+                    print(Colors.colorize("Or run git rebase --abort to go back", Colors.YELLOW))
+                return False
+
+            # Success banner, written in one go
+            new_hash_display = Colors.colorize(new_sha[:8], Colors.BRIGHT_GREEN, bold=True)
+            print("\n".join([
+                "",
+                _SEPARATOR,
+                f"✅ Successfully converted to squash commit: {new_hash_display}",
+                _SEPARATOR,
+                "",
+                Colors.colorize("The commit message has been rewritten to:", Colors.WHITE, bold=True),
+                f"  {squash_message}",
+                "",
+                Colors.colorize("Next steps:", Colors.WHITE, bold=True),
+                "  Use git rebase -i --autosquash to apply the squash",
+                "",
+            ]))
+
+            return True
+
         except Exception as e:
             print(Colors.colorize(f"❌ Error during resquash: {e}", Colors.BRIGHT_RED))
-            import traceback
             traceback.print_exc()
             return False
\ No newline at end of file
@@ -1,10 +1,13 @@
 """Git analysis functionality for finding fixup targets."""
 
+import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple, Union
 from enum import Enum
 import difflib
 import threading
@@ -59,7 +62,7 @@ class FilterMode(Enum):
     INCLUDE_ALL = "include_all"             # Show all changes regardless
 
 
-@dataclass(frozen=True)
+@dataclass
 class ChangedLine:
     """Represents a changed line in a file."""
     file_path: str
@@ -79,6 +82,10 @@ class BlameInfo:
     line_content: str
 
 
+# Collapses runs of whitespace (including newlines) in commit messages
+_WS_RE = re.compile(r'\s+')
+
+
 @dataclass
 class FixupTarget:
     """A target commit for creating fixups."""
@@ -86,7 +93,112 @@ class FixupTarget:
     commit_message: str
     author: str
     changed_lines: List[ChangedLine]
-    files: Set[str]
+    files: Tuple[str, ...]  # Sorted, unique file paths
+
+    @cached_property
+    def short_hash(self) -> str:
+        """Abbreviated commit hash used in listings."""
+        return self.commit_hash[:8]
+
+    @cached_property
+    def one_line_message(self) -> str:
+        """Commit message with newlines and runs of whitespace collapsed to single spaces."""
+        return _WS_RE.sub(' ', self.commit_message).strip()
+
+    @cached_property
+    def lines_by_file(self) -> Dict[str, List[ChangedLine]]:
+        """Changed lines grouped by file path, in their original order."""
+        by_file: Dict[str, List[ChangedLine]] = {}
+        for line in self.changed_lines:
+            by_file.setdefault(line.file_path, []).append(line)
+        return by_file
+
+
+# Persistent blame cache, stored inside the repository's git directory
+_BLAME_CACHE_DIR = "fastfixupfinder-cache"
+_BLAME_CACHE_FILE = "blame.json"
+
+# Lines around an added line whose blame decides its target
+_CONTEXT_OFFSETS = (-2, -1, 1, 2)
+
+# A full object name, as at the start of each git blame --incremental entry
+_HEX_RE = re.compile(r'[0-9a-f]{40}(?:[0-9a-f]{24})?')
+
+# Classifier heuristics; each list is joined into one alternation so a line is scanned once per category
+_FIXUP_CONTENT_RE = re.compile('|'.join(f'(?:{p})' for p in (
+    r'\b(fix|correct|update)\b',  # Fix/correct/update
+    r'\b(typo|spelling|grammar)\b',  # Typo fixes
+    r'\b(format|style|indent)\b',  # Style fixes
+    r'^\s*(#|//|\*)',  # Comment changes
+    r'^[^a-zA-Z]*$',  # Only symbols/numbers (formatting)
+    r'^\s*["\'].*["\'][\s,;]*$',  # String literal changes
+)))
+_COMPLEXITY_RE = re.compile('|'.join(f'(?:{p})' for p in (
+    r'def\s+\w+\s*\(',  # New function definition
+    r'class\s+\w+',     # New class definition
+    r'import\s+\w+',    # New imports
+    r'if\s+.*:\s*$',    # New conditional blocks
+    r'for\s+.*:\s*$',   # New loops
+    r'while\s+.*:\s*$', # New while loops
+)))
+_STRUCTURE_RE = re.compile('|'.join(f'(?:{p})' for p in (
+    r'^\s*def\s+\w+',      # New function
+    r'^\s*class\s+\w+',    # New class
+    r'^\s*if\s+__name__',  # New main block
+    r'^\s*@\w+',           # New decorator
+    r'^\s*from\s+\w+\s+import',  # New imports
+)))
+
+# Headers in git diff output; a hunk header is @@ -old_start[,old_count] +new_start[,new_count] @@.
+# DIFF_HUNK_RE is shared with fixup_creator, which parses the worktree diff with it
+_DIFF_GIT_RE = re.compile(r'diff --git a/(.+) b/(.+)$')
+DIFF_HUNK_RE = re.compile(r'@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+# Changed lines this short (blank lines, braces, boilerplate) repeat a lot; share one string each
+_INTERN_MAX_LEN = 80
+
+# Author email, in angle brackets or as a bare address
+_BRACKETED_EMAIL_RE = re.compile(r'<([^>]+)>')
+_BARE_EMAIL_RE = re.compile(r'\S+@\S+\.\S+')
+
+# Org email patterns that accept every author who has an email, so the regex can be skipped
+_MATCH_ALL_EMAIL_PATTERNS = ('', '.*', '.+')
+
+
+def _intern_short(text: str) -> str:
+    """Intern short diff line contents so repeated lines share one string object."""
+    return sys.intern(text) if len(text) < _INTERN_MAX_LEN else text
+
+
+def _email_matcher(org_email_pattern: Pattern[str]) -> Callable[[Optional[str]], bool]:
+    """Return a predicate for author emails; authors without an email never match."""
+    pattern_text = org_email_pattern.pattern
+    if pattern_text in _MATCH_ALL_EMAIL_PATTERNS:
+        return bool
+
+    # Case-insensitive patterns without regex metacharacters only need a substring check
+    if org_email_pattern.flags & re.IGNORECASE and re.escape(pattern_text) == pattern_text:
+        literal = pattern_text.lower()
+        return lambda email: bool(email) and literal in email.lower()
+    return lambda email: bool(email) and org_email_pattern.search(email) is not None
+
+
+def compile_org_email_pattern(org_email_pattern: str) -> Pattern[str]:
+    """Compile an organization email regex once for reuse across filtering calls.
+
+    Args:
+        org_email_pattern: Regex pattern to match against author email addresses
+
+    Returns:
+        Case-insensitive compiled pattern
+
+    Raises:
+        ValueError: If the email pattern is not a valid regex
+    """
+    try:
+        return re.compile(org_email_pattern, re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Invalid email pattern '{org_email_pattern}': {e}")
 
 
 class ChangeClassifier:
@@ -94,6 +206,8 @@ class ChangeClassifier:
     
     def __init__(self, repo: git.Repo):
         self.repo = repo
+        self._new_file_cache: Dict[str, bool] = {}
+        self._commit_date_cache: Dict[str, int] = {}
     
     def classify_change(self, change: ChangedLine, target_commit_hash: str = None) -> ChangeClassification:
         """Classify a change based on multiple heuristics."""
@@ -121,30 +235,26 @@ class ChangeClassifier:
     
     def _is_new_file(self, file_path: str) -> bool:
         """Check if this is a completely new file."""
+        # Called once per changed line; cleared by the analyzer before each classification pass
+        cached = self._new_file_cache.get(file_path)
+        if cached is not None:
+            return cached
         try:
-            # Try to get the file from HEAD
-            self.repo.git.show(f"HEAD:{file_path}")
-            return False
-        except git.exc.GitCommandError:
-            return True
+            # Ask GitPython's long-running cat-file --batch-check process instead of spawning git show
+            self.repo.git.get_object_header(f"HEAD:{file_path}")
+            is_new = False
+        except ValueError:
+            is_new = True
+        self._new_file_cache[file_path] = is_new
+        return is_new
     
     def _is_likely_fixup_content(self, change: ChangedLine) -> bool:
         """Check if content suggests this is likely a fixup."""
         content = change.content.strip().lower()
         
         # Typo fixes and small corrections
-        fixup_patterns = [
-            r'\b(fix|correct|update)\b',  # Fix/correct/update
-            r'\b(typo|spelling|grammar)\b',  # Typo fixes
-            r'\b(format|style|indent)\b',  # Style fixes
-            r'^\s*(#|//|\*)',  # Comment changes
-            r'^[^a-zA-Z]*$',  # Only symbols/numbers (formatting)
-            r'^\s*["\'].*["\'][\s,;]*$',  # String literal changes
-        ]
-        
-        for pattern in fixup_patterns:
-            if re.search(pattern, content):
-                return True
+        if _FIXUP_CONTENT_RE.search(content):
+            return True
         
         # Small single-character or word changes
         if len(content) < 10:
@@ -161,28 +271,17 @@ class ChangeClassifier:
             return True
         
         # Complex expressions suggest new logic
-        complexity_indicators = [
-            r'def\s+\w+\s*\(',  # New function definition
-            r'class\s+\w+',     # New class definition
-            r'import\s+\w+',    # New imports
-            r'if\s+.*:\s*$',    # New conditional blocks
-            r'for\s+.*:\s*$',   # New loops
-            r'while\s+.*:\s*$', # New while loops
-        ]
-        
-        for pattern in complexity_indicators:
-            if re.search(pattern, content):
-                return True
-        
-        return False
+        return _COMPLEXITY_RE.search(content) is not None
     
     def _is_old_commit(self, commit_hash: str, days_threshold: int = 30) -> bool:
         """Check if the target commit is old (less likely to need fixups)."""
         try:
-            commit = self.repo.commit(commit_hash)
-            commit_date = datetime.fromtimestamp(commit.committed_date)
-            age = datetime.now() - commit_date
-            return age > timedelta(days=days_threshold)
+            # A commit's date never changes, so each commit is looked up only once
+            committed_date = self._commit_date_cache.get(commit_hash)
+            if committed_date is None:
+                committed_date = self._commit_date_cache[commit_hash] = self.repo.commit(commit_hash).committed_date
+            # Both are Unix timestamps, so the age needs no datetime objects
+            return time.time() - committed_date > days_threshold * 86400
         except:
             return False
     
@@ -191,19 +290,7 @@ class ChangeClassifier:
         content = change.content.strip()
         
         # Look for new structural additions
-        structure_patterns = [
-            r'^\s*def\s+\w+',      # New function
-            r'^\s*class\s+\w+',    # New class  
-            r'^\s*if\s+__name__',  # New main block
-            r'^\s*@\w+',           # New decorator
-            r'^\s*from\s+\w+\s+import',  # New imports
-        ]
-        
-        for pattern in structure_patterns:
-            if re.search(pattern, content):
-                return True
-        
-        return False
+        return _STRUCTURE_RE.search(content) is not None
 
 
 class GitAnalyzer:
@@ -214,18 +301,19 @@ class GitAnalyzer:
         self.repo = git.Repo(repo_path)
         self.repo_path = Path(repo_path)
         self.classifier = ChangeClassifier(self.repo)
+        # Blame results for HEAD: {file_path: {str(line_number): commit_hash or None}}
+        self._blame_cache: Optional[Dict[str, Dict[str, Optional[str]]]] = None
+        self._blame_cache_head: Optional[str] = None
+        self._blame_cache_dirty = False
+        # Commit objects by full hash; they are immutable, and keep their parsed data once read
+        self._commit_cache: Dict[str, git.Commit] = {}
+        # Targets the last find_fixup_targets call dropped for their author email
+        self.author_filtered_count = 0
     
     def get_changed_lines(self) -> List[ChangedLine]:
         """Get all changed lines in the working directory."""
-        changed_lines = []
-        
-        # Get unstaged changes
-        diff = self.repo.git.diff('HEAD', unified=0)
-        changed_lines.extend(self._parse_diff(diff, 'unstaged'))
-        
-        # Get staged changes
-        diff = self.repo.git.diff('--cached', unified=0)
-        changed_lines.extend(self._parse_diff(diff, 'staged'))
+        # Staged and unstaged changes alike, both relative to HEAD
+        changed_lines = self._parse_diff(self._stream_diff('HEAD'))
         
         # Post-process to detect delete/add pairs as modifications
         enhanced_lines = self._enhance_change_detection(changed_lines)
@@ -235,51 +323,67 @@ class GitAnalyzer:
         
         return classified_lines
     
-    def _parse_diff(self, diff_output: str, change_source: str) -> List[ChangedLine]:
-        """Parse git diff output to extract changed lines."""
+    def _stream_diff(self, *args: str) -> Iterator[str]:
+        """Yield the lines of a zero-context git diff as git writes them."""
+        # Explicit prefixes, so diff.noprefix or diff.mnemonicPrefix can't break _DIFF_GIT_RE
+        proc = self.repo.git.diff(*args, '--src-prefix=a/', '--dst-prefix=b/', unified=0, as_process=True)
+        for raw_line in proc.stdout:
+            yield raw_line.decode('utf-8', 'surrogateescape').rstrip('\n')
+        # Raises GitCommandError if git failed, like a plain repo.git.diff call
+        proc.wait()
+    
+    def _parse_diff(self, diff_lines: Iterable[str]) -> List[ChangedLine]:
+        """Parse git diff output lines to extract changed lines."""
         changed_lines = []
+        append = changed_lines.append
         current_file = None
+        # Set by each hunk header; a stray line before one can't raise UnboundLocalError
+        old_line_num = new_line_num = 0
         
-        for line in diff_output.split('\n'):
-            if line.startswith('diff --git'):
-                # Extract file path from: diff --git a/path/file.c b/path/file.c
-                match = re.search(r'diff --git a/(.+) b/(.+)$', line)
-                if match:
-                    # Use the 'b/' path (destination) as it's more reliable
-                    current_file = match.group(2)
-            elif line.startswith('@@'):
+        for line in diff_lines:
+            # Dispatch on the leading character; file headers are told apart by their first three
+            lead = line[:1]
+            if lead == '+':
+                # Added line
+                if current_file and line[:3] != '+++':
+                    append(ChangedLine(
+                        file_path=current_file,
+                        line_number=new_line_num,
+                        content=_intern_short(line[1:]),
+                        change_type='added'
+                    ))
+                    new_line_num += 1
+            elif lead == '-':
+                # Deleted line
+                if current_file and line[:3] != '---':
+                    append(ChangedLine(
+                        file_path=current_file,
+                        line_number=old_line_num,
+                        content=_intern_short(line[1:]),
+                        change_type='deleted'
+                    ))
+                    old_line_num += 1
+            elif lead == '@':
+                if line[1:2] != '@':
+                    continue
                 # Parse hunk header to get line numbers
-                match = re.search(r'@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@', line)
+                match = DIFF_HUNK_RE.search(line)
                 if match and current_file:
                     old_start = int(match.group(1))
                     new_start = int(match.group(3))
                     # We'll track line numbers as we process the hunk
                     old_line_num = old_start
                     new_line_num = new_start
-            elif line.startswith('-') and not line.startswith('---'):
-                # Deleted line
-                if current_file:
-                    changed_lines.append(ChangedLine(
-                        file_path=current_file,
-                        line_number=old_line_num,
-                        content=line[1:],
-                        change_type='deleted'
-                    ))
-                    old_line_num += 1
-            elif line.startswith('+') and not line.startswith('+++'):
-                # Added line
-                if current_file:
-                    changed_lines.append(ChangedLine(
-                        file_path=current_file,
-                        line_number=new_line_num,
-                        content=line[1:],
-                        change_type='added'
-                    ))
-                    new_line_num += 1
-            elif line.startswith(' '):
+            elif lead == ' ':
                 # Unchanged line (context)
                 old_line_num += 1
                 new_line_num += 1
+            elif lead == 'd' and line.startswith('diff --git'):
+                # Extract file path from: diff --git a/path/file.c b/path/file.c
+                match = _DIFF_GIT_RE.search(line)
+                if match:
+                    # Use the 'b/' path (destination) as it's more reliable; every line of the file shares it
+                    current_file = sys.intern(match.group(2))
         
         return changed_lines
     
@@ -300,58 +404,59 @@ class GitAnalyzer:
             added_lines = [l for l in lines if l.change_type == 'added']
             other_lines = [l for l in lines if l.change_type not in ['deleted', 'added']]
             
-            # Keep track of which lines we've paired
-            used_deleted = set()
-            used_added = set()
+            # Keep track of which lines we've paired, by position (hashing the lines themselves costs more)
+            used_deleted = [False] * len(deleted_lines)
+            used_added = [False] * len(added_lines)
+            
+            # Positions of added lines by line number
+            added_by_number: Dict[int, List[int]] = {}
+            for index, add_line in enumerate(added_lines):
+                added_by_number.setdefault(add_line.line_number, []).append(index)
             
             # Try to pair deleted and added lines that are similar
-            for del_line in deleted_lines:
-                if del_line in used_deleted:
+            for del_index, del_line in enumerate(deleted_lines):
+                if used_deleted[del_index]:
                     continue
                     
                 best_match = None
                 best_similarity = 0.0
                 
-                for add_line in added_lines:
-                    if add_line in used_added:
-                        continue
-                    
-                    # Check if lines are close in location (within ~5 lines)
-                    line_distance = abs(add_line.line_number - del_line.line_number)
-                    if line_distance > 5:
+                # Only lines close in location (within ~5 lines) are candidates, in their original order
+                candidates = sorted(
+                    index
+                    for number in range(del_line.line_number - 5, del_line.line_number + 6)
+                    for index in added_by_number.get(number, ())
+                )
+                for add_index in candidates:
+                    if used_added[add_index]:
                         continue
                     
                     # Calculate content similarity
-                    similarity = self._calculate_similarity(del_line.content, add_line.content)
+                    similarity = self._calculate_similarity(del_line.content, added_lines[add_index].content, 0.6)
                     
                     # Consider it a match if similarity > 60% and they're close
                     if similarity > 0.6 and similarity > best_similarity:
-                        best_match = add_line
+                        best_match = add_index
                         best_similarity = similarity
                 
-                if best_match:
+                if best_match is not None:
                     # Create a modified line using the deleted line's position for blame
                     modified_line = ChangedLine(
                         file_path=del_line.file_path,
-                        line_number=del_line.line_number,  # Use original line number for blame
-                        content=best_match.content,        # New content
-                        change_type='modified'             # Mark as modification
+                        line_number=del_line.line_number,      # Use original line number for blame
+                        content=added_lines[best_match].content,  # New content
+                        change_type='modified'                 # Mark as modification
                     )
                     enhanced_lines.append(modified_line)
-                    used_deleted.add(del_line)
-                    used_added.add(best_match)
+                    used_deleted[del_index] = True
+                    used_added[best_match] = True
                 else:
                     # No match found, keep as deleted
                     enhanced_lines.append(del_line)
             
             # Add remaining unmatched lines
-            for del_line in deleted_lines:
-                if del_line not in used_deleted:
-                    enhanced_lines.append(del_line)
-            
-            for add_line in added_lines:
-                if add_line not in used_added:
-                    enhanced_lines.append(add_line)
+            enhanced_lines.extend(line for line, used in zip(deleted_lines, used_deleted) if not used)
+            enhanced_lines.extend(line for line, used in zip(added_lines, used_added) if not used)
             
             # Add other line types unchanged
             enhanced_lines.extend(other_lines)
@@ -360,26 +465,19 @@ class GitAnalyzer:
     
     def _classify_changes(self, changed_lines: List[ChangedLine]) -> List[ChangedLine]:
         """Classify all changes for fixup likelihood."""
-        classified_lines = []
-        
+        # HEAD may have moved since the last analysis (e.g. a fixup adding a file was committed)
+        self.classifier._new_file_cache.clear()
+        # The lines are fresh from this analysis, so they are classified in place
         for line in changed_lines:
-            classification = self.classifier.classify_change(line)
-            
-            # Create new ChangedLine with classification
-            classified_line = ChangedLine(
-                file_path=line.file_path,
-                line_number=line.line_number,
-                content=line.content,
-                change_type=line.change_type,
-                classification=classification,
-                context_lines=line.context_lines
-            )
-            classified_lines.append(classified_line)
+            line.classification = self.classifier.classify_change(line)
         
-        return classified_lines
+        return changed_lines
     
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """Calculate similarity between two strings using difflib."""
+    def _calculate_similarity(self, str1: str, str2: str, threshold: float = 0.0) -> float:
+        """Calculate similarity between two strings using difflib.
+        
+        Pairs that cannot score above threshold get 0.0 without the full comparison.
+        """
         # Remove leading/trailing whitespace for comparison
         str1 = str1.strip()
         str2 = str2.strip()
@@ -387,10 +485,20 @@ class GitAnalyzer:
         if not str1 or not str2:
             return 0.0
         
-        # Use difflib's SequenceMatcher to calculate similarity
+        # Use difflib's SequenceMatcher to calculate similarity; the quick
+        # ratios are cheap upper bounds of ratio()
         matcher = difflib.SequenceMatcher(None, str1, str2)
+        if matcher.real_quick_ratio() <= threshold or matcher.quick_ratio() <= threshold:
+            return 0.0
         return matcher.ratio()
     
+    def _get_commit(self, commit_hash: str) -> git.Commit:
+        """Commit object for a hash, reusing the one already looked up for it."""
+        commit = self._commit_cache.get(commit_hash)
+        if commit is None:
+            commit = self._commit_cache[commit_hash] = self.repo.commit(commit_hash)
+        return commit
+    
     def get_blame_info(self, file_path: str, line_number: int) -> Optional[BlameInfo]:
         """Get blame information for a specific line."""
         try:
@@ -410,7 +518,7 @@ class GitAnalyzer:
             commit_hash = first_line.split()[0]
             
             # Extract commit info
-            commit = self.repo.commit(commit_hash)
+            commit = self._get_commit(commit_hash)
             
             # Find the actual line content
             line_content = ""
@@ -429,14 +537,194 @@ class GitAnalyzer:
         except git.exc.GitCommandError:
             return None
     
-    def find_fixup_targets(self, filter_mode: FilterMode = FilterMode.SMART_DEFAULT, progress_callback=None, limit_sha: Optional[str] = None) -> List[FixupTarget]:
+    def _blame_cache_path(self) -> Path:
+        """Location of the persistent blame cache inside the git directory."""
+        return Path(self.repo.git_dir) / _BLAME_CACHE_DIR / _BLAME_CACHE_FILE
+    
+    def _load_blame_cache(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Load blame results persisted by an earlier run, keeping only those still valid at HEAD.
+        
+        Blame is always taken against HEAD, so a line's originating commit only
+        changes when HEAD does; working tree edits never invalidate entries.
+        When HEAD merely moved forward (e.g. a fixup was committed), files the
+        new commits didn't touch keep their entries.
+        """
+        head = self.repo.head.commit.hexsha
+        self._blame_cache_head = head
+        try:
+            with open(self._blame_cache_path(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(data, dict) or not isinstance(data.get('files'), dict):
+            return {}
+        cached_head = data.get('head')
+        if cached_head == head:
+            return data['files']
+        if not isinstance(cached_head, str) or not _HEX_RE.fullmatch(cached_head):
+            return {}
+        
+        # A rewritten history (rebase, amend, reset) can change any line's commit; start over
+        try:
+            self.repo.git.merge_base('--is-ancestor', cached_head, head)
+            touched = self.repo.git.diff('--name-only', '--no-renames', cached_head, head).split('\n')
+        except git.exc.GitCommandError:
+            return {}
+        if any(file_path.startswith('"') for file_path in touched):
+            return {}  # Quoted (unusual) path names; don't guess how they map to cache keys
+        files = data['files']
+        for file_path in touched:
+            files.pop(file_path, None)
+        self._blame_cache_dirty = True
+        return files
+    
+    def _save_blame_cache(self) -> None:
+        """Persist blame results for reuse by later runs against this HEAD or its descendants."""
+        if self._blame_cache is None or not self._blame_cache_dirty:
+            return
+        
+        cache_path = self._blame_cache_path()
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'head': self._blame_cache_head, 'files': self._blame_cache}, f)
+            os.replace(tmp_path, cache_path)
+            self._blame_cache_dirty = False
+        except OSError:
+            # The cache is only an optimization; never fail the analysis over it
+            pass
+    
+    def _file_blame_cache(self, file_path: str) -> Dict[str, Optional[str]]:
+        """Cached blame results of one file, loading the persistent cache on first use."""
+        if self._blame_cache is None:
+            self._blame_cache = self._load_blame_cache()
+        return self._blame_cache.setdefault(file_path, {})
+    
+    def _prefetch_blame(self, changed_lines: List[ChangedLine]) -> None:
+        """Blame every line the changed lines will ask about, with one git blame per file."""
+        wanted: Dict[str, Set[int]] = {}
+        for line in changed_lines:
+            if line.change_type in ('deleted', 'modified'):
+                wanted.setdefault(line.file_path, set()).add(line.line_number)
+            elif line.change_type == 'added':
+                # Same neighbours _find_context_commits looks at
+                wanted.setdefault(line.file_path, set()).update(
+                    n for n in (line.line_number + offset for offset in _CONTEXT_OFFSETS) if n > 0)
+        
+        jobs = []
+        for file_path, line_numbers in wanted.items():
+            file_cache = self._file_blame_cache(file_path)
+            missing = sorted(n for n in line_numbers if str(n) not in file_cache)
+            if missing:
+                jobs.append((file_path, missing))
+        
+        if len(jobs) <= 1:
+            results = [self._blame_lines(*job) for job in jobs]
+        else:
+            # The workers only run git subprocesses; everything that touches the
+            # caches or GitPython's shared cat-file process stays on this thread
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs), os.cpu_count() or 1)) as pool:
+                results = list(pool.map(lambda job: self._blame_lines(*job), jobs))
+        for (file_path, line_numbers), blamed in zip(jobs, results):
+            self._store_blame(file_path, line_numbers, blamed)
+    
+    def _store_blame(self, file_path: str, line_numbers: List[int], blamed: Dict[int, str]) -> None:
+        """Record blame results in the cache; lines missing from blamed have no commit."""
+        file_cache = self._file_blame_cache(file_path)
+        for n in line_numbers:
+            file_cache[str(n)] = blamed.get(n)
+        self._blame_cache_dirty = True
+    
+    def _blame_lines(self, file_path: str, line_numbers: List[int]) -> Dict[int, str]:
+        """Blame the given (sorted) lines of a file at HEAD in a single git blame run.
+        
+        Only runs git subprocesses, so it is safe to call from worker threads.
+        Lines past the end of the file at HEAD are left out of the result.
+        """
+        blamed = self._run_blame(file_path, line_numbers)
+        if blamed is None:
+            # Typically a range past the end of the file (the neighbours of a line
+            # appended at the end), which fails the whole run; blame once more
+            # without the lines HEAD doesn't have, leaving only those empty
+            line_count = self._head_line_count(file_path)
+            in_file = [n for n in line_numbers if n <= line_count]
+            blamed = (self._run_blame(file_path, in_file) if in_file else None) or {}
+        return blamed
+    
+    def _run_blame(self, file_path: str, line_numbers: List[int]) -> Optional[Dict[int, str]]:
+        """Commit of each of the given (sorted) lines at HEAD, or None if git blame fails."""
+        # Consecutive line numbers become one -L range each
+        ranges: List[List[int]] = []
+        for n in line_numbers:
+            if ranges and n == ranges[-1][1] + 1:
+                ranges[-1][1] = n
+            else:
+                ranges.append([n, n])
+        
+        try:
+            blame_output = self.repo.git.blame(
+                'HEAD', '--incremental', *(f'-L{start},{end}' for start, end in ranges), '--', file_path)
+        except git.exc.GitCommandError:
+            return None
+        
+        # Each incremental entry starts with "<sha> <orig line> <final line> <line count>"
+        blamed: Dict[int, str] = {}
+        for line in blame_output.split('\n'):
+            fields = line.split(' ')
+            if len(fields) == 4 and _HEX_RE.fullmatch(fields[0]):
+                final_line, count = int(fields[2]), int(fields[3])
+                for n in range(final_line, final_line + count):
+                    blamed[n] = fields[0]
+        return blamed
+    
+    def _head_line_count(self, file_path: str) -> int:
+        """Number of lines of the file at HEAD, counted the way git blame does (0 if it isn't there)."""
+        try:
+            content = self.repo.git.cat_file('blob', f"HEAD:{file_path}",
+                                             stdout_as_string=False, strip_newline_in_stdout=False)
+        except git.exc.GitCommandError:
+            return 0
+        # A last line without a newline still counts
+        return content.count(b'\n') + (1 if content and not content.endswith(b'\n') else 0)
+    
+    def _blame_commit(self, file_path: str, line_number: int) -> Optional[str]:
+        """Get the commit hash that last changed a line at HEAD, using the blame cache."""
+        file_cache = self._file_blame_cache(file_path)
+        key = str(line_number)
+        if key not in file_cache:
+            blame_info = self.get_blame_info(file_path, line_number)
+            file_cache[key] = blame_info.commit_hash if blame_info else None
+            self._blame_cache_dirty = True
+        return file_cache[key]
+    
+    def find_fixup_targets(self, filter_mode: FilterMode = FilterMode.SMART_DEFAULT, progress_callback=None, limit_sha: Optional[str] = None,
+                           filter_author_email: Optional[Pattern[str]] = None) -> List[FixupTarget]:
         """Find all potential fixup targets based on current changes.
 
         Args:
             filter_mode: How to filter the results (SMART_DEFAULT, FIXUPS_ONLY, INCLUDE_ALL)
             progress_callback: Optional callback function for progress updates
             limit_sha: Optional SHA1 to limit search to commits after this point
+            filter_author_email: Optional compiled pattern (see compile_org_email_pattern);
+                only targets whose author email matches are returned. The number of
+                targets dropped this way is left in author_filtered_count.
         """
+        return list(self.iter_fixup_targets(filter_mode, progress_callback, limit_sha, filter_author_email))
+
+    def iter_fixup_targets(self, filter_mode: FilterMode = FilterMode.SMART_DEFAULT, progress_callback=None, limit_sha: Optional[str] = None,
+                           filter_author_email: Optional[Pattern[str]] = None) -> Iterator[FixupTarget]:
+        """Yield potential fixup targets one at a time; see find_fixup_targets for the arguments.
+
+        Every changed line has to be blamed before the first target is known,
+        but after that each target goes through the mode, limit and author
+        filters on its own, without intermediate lists.
+        """
+        # Resolve the limit before any diff or blame work, so a bad limit fails fast.
+        # A limit of HEAD still selects fixups for HEAD itself, so it is not a no-op.
+        commits_after = self._commits_after(limit_sha) if limit_sha else None
+
         if progress_callback:
             progress_callback("🔄 Getting changed lines...")
         changed_lines = self.get_changed_lines()
@@ -446,19 +734,21 @@ class GitAnalyzer:
         
         if progress_callback:
             progress_callback(f"🔍 Analyzing {len(changed_lines)} changed lines...")
+        self._prefetch_blame(changed_lines)
         
+        # Update progress every 10 lines for larger changes
+        total_lines = len(changed_lines)
+        line_progress = progress_callback if total_lines > 20 else None
         for i, changed_line in enumerate(changed_lines):
-            # Update progress every 10 lines for larger changes
-            if progress_callback and len(changed_lines) > 20 and i % 10 == 0:
-                progress_callback(f"🔍 Processing line {i+1}/{len(changed_lines)}...")
+            if line_progress and i % 10 == 0:
+                line_progress(f"🔍 Processing line {i+1}/{total_lines}...")
             # For deleted/modified lines, find the original commit
             if changed_line.change_type in ['deleted', 'modified']:
-                blame_info = self.get_blame_info(
+                commit_hash = self._blame_commit(
                     changed_line.file_path, 
                     changed_line.line_number
                 )
-                if blame_info:
-                    commit_hash = blame_info.commit_hash
+                if commit_hash:
                     if commit_hash not in commit_groups:
                         commit_groups[commit_hash] = []
                     commit_groups[commit_hash].append(changed_line)
@@ -477,81 +767,79 @@ class GitAnalyzer:
                         commit_groups[commit_hash] = []
                     commit_groups[commit_hash].append(changed_line)
         
-        # Convert to FixupTarget objects
-        fixup_targets = []
+        self._save_blame_cache()
+
+        email_matches = _email_matcher(filter_author_email) if filter_author_email is not None else None
+        self.author_filtered_count = 0
+
+        # Apply filtering based on filter mode, limit and author while building targets
+        if progress_callback:
+            progress_callback("🎯 Applying filters...")
         for commit_hash, lines in commit_groups.items():
+            # Only keep targets that are at or after the limit SHA
+            if commits_after is not None and commit_hash not in commits_after:
+                continue
+            if not self._matches_filter_mode(lines, filter_mode):
+                continue
             try:
-                commit = self.repo.commit(commit_hash)
-                files = {line.file_path for line in lines}
-                
-                fixup_targets.append(FixupTarget(
-                    commit_hash=commit_hash,
-                    commit_message=commit.message.strip(),
-                    author=f"{commit.author.name} <{commit.author.email}>",
-                    changed_lines=lines,
-                    files=files
-                ))
+                commit = self._get_commit(commit_hash)
             except git.exc.BadName:
                 continue
-        
-        # Apply filtering based on filter mode
-        if progress_callback:
-            progress_callback("🎯 Applying filters...")
-        filtered_targets = self._filter_targets_by_mode(fixup_targets, filter_mode)
-
-        # Filter by limit_sha if provided
-        if limit_sha:
-            try:
-                # Get the short SHA for comparison
-                limit_short = limit_sha[:7] if len(limit_sha) >= 7 else limit_sha
 
-                # Only keep targets that are at or after the limit SHA
-                # Get the list of commits after limit_sha
-                try:
-                    commits_after = self.repo.git.rev_list(f"{limit_sha}...HEAD").split('\n')
-                    commits_after_set = set(c[:7] for c in commits_after if c)
-                    commits_after_set.add(limit_short)  # Include the limit SHA itself
-
-                    filtered_targets = [t for t in filtered_targets if t.commit_hash[:7] in commits_after_set]
-                except git.exc.GitCommandError:
-                    raise ValueError(f"Invalid SHA1 limit: {limit_sha}")
-            except Exception as e:
-                raise ValueError(f"Error filtering by limit SHA '{limit_sha}': {e}")
+            target = FixupTarget(
+                commit_hash=commit_hash,
+                commit_message=commit.message.strip(),
+                author=f"{commit.author.name} <{commit.author.email}>",
+                changed_lines=lines,
+                files=tuple(sorted({line.file_path for line in lines}))
+            )
+            # Author is checked last, so the dropped count covers real targets only
+            if email_matches is not None and not email_matches(self._extract_email_from_author(target.author)):
+                self.author_filtered_count += 1
+                continue
+            yield target
 
         if progress_callback:
             progress_callback("✅ Analysis complete")
 
-        return filtered_targets
+    def _commits_after(self, limit_sha: str) -> Set[str]:
+        """Full hashes of the limit commit and every commit after it up to HEAD."""
+        try:
+            # Resolve the limit once so targets can be compared by full hash
+            try:
+                limit_full = self.repo.git.rev_parse('--verify', f"{limit_sha}^{{commit}}")
+                # Streamed, so a long history is never held as one string and a list of lines
+                proc = self.repo.git.rev_list(f"{limit_full}...HEAD", as_process=True)
+                commits_after_set = {line.rstrip().decode('ascii') for line in proc.stdout if line.strip()}
+                proc.wait()
+                commits_after_set.add(limit_full)  # Include the limit SHA itself
+                return commits_after_set
+            except git.exc.GitCommandError:
+                raise ValueError(f"Invalid SHA1 limit: {limit_sha}")
+        except Exception as e:
+            raise ValueError(f"Error filtering by limit SHA '{limit_sha}': {e}")
     
-    def filter_targets_by_organization(self, targets: List[FixupTarget], org_email_pattern: str) -> List[FixupTarget]:
+    def filter_targets_by_organization(self, targets: List[FixupTarget],
+                                       org_email_pattern: Union[str, Pattern[str]]) -> List[FixupTarget]:
         """Filter targets to only include commits by authors matching the organization email pattern.
         
         Args:
             targets: List of fixup targets to filter
-            org_email_pattern: Regex pattern to match against author email addresses
+            org_email_pattern: Regex (string or compiled, see compile_org_email_pattern) to
+                match against author email addresses
             
         Returns:
             Filtered list containing only targets where author email matches the pattern
             
         Raises:
-            ValueError: If email pattern is invalid or matches no authors in repository
+            ValueError: If a string email pattern is not a valid regex
         """
-        try:
-            pattern = re.compile(org_email_pattern, re.IGNORECASE)
-        except re.error as e:
-            raise ValueError(f"Invalid email pattern '{org_email_pattern}': {e}")
-        
+        if isinstance(org_email_pattern, str):
+            org_email_pattern = compile_org_email_pattern(org_email_pattern)
         # Note: We don't validate if the pattern matches any authors here anymore.
         # The CLI will handle showing appropriate messages about unmatched patterns.
-        
-        filtered_targets = []
-        for target in targets:
-            # Extract email from author string (format is usually "Name <email>")
-            author_email = self._extract_email_from_author(target.author)
-            if author_email and pattern.search(author_email):
-                filtered_targets.append(target)
-        
-        return filtered_targets
+        email_matches = _email_matcher(org_email_pattern)
+        return [target for target in targets if email_matches(self._extract_email_from_author(target.author))]
     
     def _extract_email_from_author(self, author_str: str) -> Optional[str]:
         """Extract email address from author string.
@@ -565,47 +853,51 @@ class GitAnalyzer:
             Email address if found, None otherwise
         """
         # Match email in angle brackets: "Name <email@domain.com>"
-        email_match = re.search(r'<([^>]+)>', author_str)
+        email_match = _BRACKETED_EMAIL_RE.search(author_str)
         if email_match:
             return email_match.group(1)
         
         # If no angle brackets, check if the whole string looks like an email
         if '@' in author_str and '.' in author_str:
             # Simple check if it's just an email address
-            email_match = re.search(r'\S+@\S+\.\S+', author_str)
+            email_match = _BARE_EMAIL_RE.search(author_str)
             if email_match:
                 return email_match.group(0)
         
         return None
     
-    def get_diff_context(self, target: 'FixupTarget', context_lines: int = 3) -> Optional[str]:
+    def get_diff_context(self, target: 'FixupTarget', context_lines: int = 3,
+                         current_changes: Optional[List[ChangedLine]] = None) -> Optional[str]:
         """Get diff context showing what changes would fix in the target commit.
         
         Args:
             target: The fixup target to show context for
             context_lines: Number of context lines to show around changes
+            current_changes: Changed lines already read for this analysis; read afresh if omitted
             
         Returns:
             Formatted diff string showing the changes, or None if unable to generate
         """
         try:
             # Get the diff for files that have changes in both current working dir and target commit
-            target_files = target.files
-            current_changes = self.get_changed_lines()
+            target_files = set(target.files)
+            if current_changes is None:
+                current_changes = self.get_changed_lines()
             current_files = {change.file_path for change in current_changes if change.file_path in target_files}
             
             if not current_files:
                 return None
             
             diff_output = []
-            diff_output.append(f"📋 Diff context for fixup target {target.commit_hash[:8]}:")
+            diff_output.append(f"📋 Diff context for fixup target {target.short_hash}:")
             diff_output.append(f"📝 Target commit: {target.commit_message}")
             diff_output.append("")
             
+            # Blobs are read through the repo's persistent cat-file --batch process
+            target_commit = self._get_commit(target.commit_hash)
             for file_path in sorted(current_files):
                 # Get the version of the file at the target commit
                 try:
-                    target_commit = self.repo.commit(target.commit_hash)
                     target_blob = target_commit.tree[file_path]
                     target_content = target_blob.data_stream.read().decode('utf-8', errors='replace')
                 except (KeyError, UnicodeDecodeError):
@@ -618,6 +910,10 @@ class GitAnalyzer:
                 except (FileNotFoundError, UnicodeDecodeError):
                     continue
                 
+                # An unchanged file has no hunks; finding that out through unified_diff is a full comparison
+                if target_content == current_content:
+                    continue
+                
                 # Generate unified diff
                 target_lines = target_content.splitlines(keepends=True)
                 current_lines = current_content.splitlines(keepends=True)
@@ -625,7 +921,7 @@ class GitAnalyzer:
                 diff_lines = list(difflib.unified_diff(
                     target_lines,
                     current_lines,
-                    fromfile=f"a/{file_path} (target commit {target.commit_hash[:8]})",
+                    fromfile=f"a/{file_path} (target commit {target.short_hash})",
                     tofile=f"b/{file_path} (current changes)",
                     n=context_lines
                 ))
@@ -641,46 +937,47 @@ class GitAnalyzer:
         except Exception:
             return None
     
-    def _filter_targets_by_mode(self, targets: List[FixupTarget], filter_mode: FilterMode) -> List[FixupTarget]:
-        """Filter fixup targets based on the specified filter mode."""
+    def _matches_filter_mode(self, lines: List[ChangedLine], filter_mode: FilterMode) -> bool:
+        """Whether a target with these changed lines passes the specified filter mode."""
         if filter_mode == FilterMode.INCLUDE_ALL:
-            return targets
+            return True
         
-        filtered_targets = []
-        for target in targets:
-            # Analyze the classification of changes in this target
-            classifications = [line.classification for line in target.changed_lines]
-            
-            if filter_mode == FilterMode.FIXUPS_ONLY:
-                # Only include targets with mostly likely fixups
-                likely_count = classifications.count(ChangeClassification.LIKELY_FIXUP)
-                total_count = len(classifications)
-                if likely_count / total_count >= 0.5:  # At least 50% likely fixups
-                    filtered_targets.append(target)
+        # Analyze the classification of changes in this target
+        classifications = [line.classification for line in lines]
+        
+        if filter_mode == FilterMode.FIXUPS_ONLY:
+            # Only include targets with mostly likely fixups
+            likely_count = classifications.count(ChangeClassification.LIKELY_FIXUP)
+            total_count = len(classifications)
+            return likely_count / total_count >= 0.5  # At least 50% likely fixups
+        
+        if filter_mode == FilterMode.SMART_DEFAULT:
+            # Exclude targets that are clearly new features
+            new_file_count = classifications.count(ChangeClassification.NEW_FILE)
+            unlikely_count = classifications.count(ChangeClassification.UNLIKELY_FIXUP)
+            total_count = len(classifications)
             
-            elif filter_mode == FilterMode.SMART_DEFAULT:
-                # Exclude targets that are clearly new features
-                new_file_count = classifications.count(ChangeClassification.NEW_FILE)
-                unlikely_count = classifications.count(ChangeClassification.UNLIKELY_FIXUP)
-                total_count = len(classifications)
-                
-                # Skip if most changes are new files or unlikely fixups
-                if (new_file_count + unlikely_count) / total_count < 0.7:  # Less than 70% unlikely
-                    filtered_targets.append(target)
+            # Skip if most changes are new files or unlikely fixups
+            return (new_file_count + unlikely_count) / total_count < 0.7  # Less than 70% unlikely
         
-        return filtered_targets
+        return False
     
     def _find_context_commits(self, file_path: str, line_number: int) -> List[str]:
         """Find commits of nearby lines for context."""
         context_commits = []
+        neighbours = [n for n in (line_number + offset for offset in _CONTEXT_OFFSETS) if n > 0]
+        
+        # Blame any neighbours the cache doesn't know yet in one window query
+        file_cache = self._file_blame_cache(file_path)
+        missing = [n for n in neighbours if str(n) not in file_cache]
+        if missing:
+            self._store_blame(file_path, missing, self._blame_lines(file_path, missing))
         
         # Check lines before and after for context
-        for offset in [-2, -1, 1, 2]:
-            target_line = line_number + offset
-            if target_line > 0:
-                blame_info = self.get_blame_info(file_path, target_line)
-                if blame_info:
-                    context_commits.append(blame_info.commit_hash)
+        for target_line in neighbours:
+            commit_hash = self._blame_commit(file_path, target_line)
+            if commit_hash:
+                context_commits.append(commit_hash)
         
         # Return unique commits, most recent first
         unique_commits = list(dict.fromkeys(context_commits))
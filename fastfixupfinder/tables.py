@@ -0,0 +1,91 @@
+"""Plain-text table rendering for Fast Fixup Finder output.
+
+These produce the same layouts as tabulate's "simple" and "fancy_grid"
+formats for pre-formatted string cells, without its per-cell type
+inference and formatting passes.
+"""
+
+import re
+import unicodedata
+from typing import List, Sequence
+
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def visible_len(text: str) -> int:
+    """Width of text as displayed, ignoring ANSI color codes and counting wide characters twice."""
+    # Most cells carry no color codes at all; skip the regex pass for them
+    plain = _ANSI_RE.sub('', text) if '\x1b' in text else text
+    if plain.isascii():
+        return len(plain)
+    width = 0
+    for ch in plain:
+        if unicodedata.category(ch) in ('Mn', 'Me', 'Cf'):
+            continue  # Combining marks, variation selectors, zero-width joiners
+        width += 2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1
+    return width
+
+
+def format_simple_table(rows: Sequence[Sequence[str]], headers: Sequence[str],
+                        right_aligned: Sequence[bool]) -> str:
+    """Render single-line cells in tabulate's "simple" layout.
+
+    Each column is either left- or right-aligned. Unlike tabulate, blanks after
+    a left-aligned last column are kept, so callers right-align that column.
+    """
+    header_lens = [visible_len(h) for h in headers]
+    row_lens = [[visible_len(cell) for cell in row] for row in rows]
+    widths = [n + 2 for n in header_lens]
+    for lens in row_lens:
+        widths = [max(w, n) for w, n in zip(widths, lens)]
+
+    def render(cells, lens):
+        padded = []
+        for cell, n, width, right in zip(cells, lens, widths, right_aligned):
+            fill = " " * (width - n)
+            padded.append(fill + cell if right else cell + fill)
+        return "  ".join(padded)
+
+    lines = [render(headers, header_lens), "  ".join("-" * w for w in widths)]
+    lines.extend(render(row, lens) for row, lens in zip(rows, row_lens))
+    return "\n".join(lines)
+
+
+def format_grid_table(rows: Sequence[Sequence[str]], headers: Sequence[str]) -> str:
+    """Render left-aligned, possibly multi-line cells in tabulate's "fancy_grid" layout."""
+    # Like tabulate, cells lose surrounding whitespace but keep inner indentation
+    cell_lines = [[cell.strip().splitlines() for cell in row] for row in rows]
+    # As in tabulate, a row of empty cells only takes up a line when no cell spans several
+    min_height = 0 if any('\n' in cell for row in rows for cell in row) else 1
+    line_lens = [[[visible_len(line) for line in lines] for lines in row] for row in cell_lines]
+
+    widths = [visible_len(h) + 2 for h in headers]
+    for row in line_lens:
+        widths = [max([w] + lens) for w, lens in zip(widths, row)]
+
+    def rule(left: str, fill: str, mid: str, right: str) -> str:
+        return left + mid.join(fill * (w + 2) for w in widths) + right
+
+    def render(cells: List[List[str]], lens: List[List[int]]) -> List[str]:
+        height = max([min_height] + [len(lines) for lines in cells])
+        out = []
+        for i in range(height):
+            padded = []
+            for lines, n, width in zip(cells, lens, widths):
+                if i < len(lines):
+                    padded.append(lines[i] + " " * (width - n[i]))
+                else:
+                    padded.append(" " * width)
+            out.append("│ " + " │ ".join(padded) + " │")
+        return out
+
+    lines = [rule("╒", "═", "╤", "╕")]
+    lines.extend(render([[h] for h in headers], [[visible_len(h)] for h in headers]))
+    lines.append(rule("╞", "═", "╪", "╡"))
+    separator = rule("├", "─", "┼", "┤")
+    for i, (cells, lens) in enumerate(zip(cell_lines, line_lens)):
+        if i:
+            lines.append(separator)
+        lines.extend(render(cells, lens))
+    lines.append(rule("╘", "═", "╧", "╛"))
+    return "\n".join(lines)
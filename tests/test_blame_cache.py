@@ -0,0 +1,111 @@
+"""Tests for the blame cache persisted in the git directory between runs."""
+
+import json
+import subprocess
+
+import pytest
+
+from fastfixupfinder.git_analyzer import ChangedLine, GitAnalyzer
+
+
+def git(repo, *args: str) -> str:
+    return subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'config', 'user.name', 'Test')
+    git(tmp_path, 'config', 'user.email', 'test@example.com')
+    return tmp_path
+
+
+def commit_files(repo, message: str, files: dict) -> str:
+    """Write the files ({path: text}) and commit them; returns the commit hash."""
+    for name, text in files.items():
+        (repo / name).write_text(text)
+    git(repo, 'add', '-A')
+    git(repo, 'commit', '-q', '-m', message)
+    return git(repo, 'rev-parse', 'HEAD').strip()
+
+
+def blame_and_save(repo, *paths: str) -> GitAnalyzer:
+    """Blame line 1 of each file with a fresh analyzer and persist the cache."""
+    analyzer = GitAnalyzer(str(repo))
+    analyzer._prefetch_blame([ChangedLine(path, 1, '', 'modified') for path in paths])
+    analyzer._save_blame_cache()
+    return analyzer
+
+
+def cache_file(repo):
+    return repo / '.git' / 'fastfixupfinder-cache' / 'blame.json'
+
+
+def test_cache_is_reused_at_the_same_head(repo, monkeypatch):
+    first = commit_files(repo, "first", {'a.txt': "a\n", 'b.txt': "b\n"})
+    blame_and_save(repo, 'a.txt', 'b.txt')
+
+    analyzer = GitAnalyzer(str(repo))
+    monkeypatch.setattr(analyzer, '_run_blame', lambda *args: pytest.fail("blamed again"))
+    analyzer._prefetch_blame([ChangedLine('a.txt', 1, '', 'modified'), ChangedLine('b.txt', 1, '', 'modified')])
+
+    assert analyzer._blame_cache == {'a.txt': {'1': first}, 'b.txt': {'1': first}}
+
+
+def test_fast_forward_drops_only_touched_files(repo):
+    first = commit_files(repo, "first", {'a.txt': "a\n", 'b.txt': "b\n"})
+    blame_and_save(repo, 'a.txt', 'b.txt')
+    # Like a fixup commit written by create
+    commit_files(repo, "fixup! first", {'a.txt': "a fixed\n"})
+
+    assert GitAnalyzer(str(repo))._load_blame_cache() == {'b.txt': {'1': first}}
+
+
+@pytest.mark.parametrize('rewrite', [
+    ['commit', '-q', '--amend', '-m', 'amended'],
+    ['reset', '-q', '--hard', 'HEAD~1'],
+])
+def test_rewritten_history_discards_the_cache(repo, rewrite):
+    commit_files(repo, "first", {'a.txt': "a\n", 'b.txt': "b\n"})
+    commit_files(repo, "second", {'a.txt': "a second\n"})
+    blame_and_save(repo, 'a.txt', 'b.txt')
+
+    git(repo, *rewrite)
+
+    assert GitAnalyzer(str(repo))._load_blame_cache() == {}
+
+
+@pytest.mark.parametrize('content', [
+    '{"head": "abc", "files":',
+    '[]',
+    '{"head": "HEAD", "files": {"a.txt": {"1": null}}}',
+    '{"head": "<head>", "files": []}',
+    '\xff\xfe',
+])
+def test_corrupt_or_foreign_cache_is_ignored(repo, content):
+    head = commit_files(repo, "first", {'a.txt': "a\n"})
+    path = cache_file(repo)
+    path.parent.mkdir()
+    path.write_text(content.replace('<head>', head), encoding='latin-1')
+
+    assert GitAnalyzer(str(repo))._load_blame_cache() == {}
+
+
+def test_saved_cache_records_head(repo):
+    head = commit_files(repo, "first", {'a.txt': "a\n"})
+    blame_and_save(repo, 'a.txt')
+
+    assert json.loads(cache_file(repo).read_text()) == {'head': head, 'files': {'a.txt': {'1': head}}}
+
+
+@pytest.mark.parametrize('text', ["one\ntwo\nthree\n", "one\ntwo\nthree"])
+def test_lines_past_the_end_of_the_file_have_no_commit(repo, text):
+    head = commit_files(repo, "first", {'a.txt': text})
+    analyzer = GitAnalyzer(str(repo))
+
+    # A -L range starting past the end makes the whole git blame run fail
+    assert analyzer._run_blame('a.txt', [2, 5, 6]) is None
+    assert analyzer._blame_lines('a.txt', [2, 5, 6]) == {2: head}
+    assert analyzer._blame_lines('a.txt', [1, 3, 4]) == {1: head, 3: head}
+    assert analyzer._blame_lines('a.txt', [4, 5]) == {}
+    assert analyzer._blame_lines('missing.txt', [1]) == {}
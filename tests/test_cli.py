@@ -0,0 +1,33 @@
+"""Tests for the command line interface."""
+
+import subprocess
+
+import pytest
+from click.testing import CliRunner
+
+from fastfixupfinder.cli import main
+
+
+def git(repo, *args: str) -> str:
+    return subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'config', 'user.name', 'Test')
+    git(tmp_path, 'config', 'user.email', 'test@example.com')
+    (tmp_path / 'f.txt').write_text("one\ntwo\n")
+    git(tmp_path, 'add', '-A')
+    git(tmp_path, 'commit', '-q', '-m', "base")
+    (tmp_path / 'f.txt').write_text("one\nTWO\n")
+    return tmp_path
+
+
+@pytest.mark.parametrize('args', [['--oneline'], []])
+def test_status_reports_targets_dropped_by_org_email(repo, args):
+    result = CliRunner().invoke(main, ['status', '--repo', str(repo), '--include-all', *args])
+
+    assert result.exit_code == 0
+    assert "Found 1 fixup targets, but none match organization email pattern '.*@intel.com'." in result.output
+    assert "No fixup targets found" not in result.output
@@ -0,0 +1,40 @@
+"""Tests for filtering fixup targets by organization email."""
+
+import re
+import subprocess
+
+import pytest
+
+from fastfixupfinder.git_analyzer import FixupTarget, GitAnalyzer
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    subprocess.run(['git', 'init', '-q'], cwd=tmp_path, check=True)
+    return GitAnalyzer(str(tmp_path))
+
+
+def target(author: str) -> FixupTarget:
+    return FixupTarget(commit_hash="0" * 40, commit_message="message", author=author, changed_lines=[], files=())
+
+
+AUTHORS = ["Dev <dev@Intel.com>", "Other <other@example.com>", "Nobody <>"]
+
+
+def kept(analyzer, pattern) -> list:
+    return [t.author for t in analyzer.filter_targets_by_organization([target(a) for a in AUTHORS], pattern)]
+
+
+@pytest.mark.parametrize('pattern', ['', '.*', '.+'])
+def test_match_all_pattern_still_needs_an_email(analyzer, pattern):
+    assert kept(analyzer, pattern) == AUTHORS[:2]
+
+
+def test_literal_pattern_is_case_insensitive(analyzer):
+    assert kept(analyzer, 'INTEL') == AUTHORS[:1]
+
+
+def test_compiled_pattern_keeps_its_case_sensitivity(analyzer):
+    assert kept(analyzer, re.compile('intel')) == []
+    assert kept(analyzer, re.compile('Intel')) == AUTHORS[:1]
+    assert kept(analyzer, re.compile('intel', re.IGNORECASE)) == AUTHORS[:1]
@@ -0,0 +1,151 @@
+"""Tests for staging worktree hunks into a chain of fixup commits."""
+
+import subprocess
+
+import pytest
+
+from fastfixupfinder.fixup_creator import FixupCreator
+from fastfixupfinder.git_analyzer import ChangedLine, FixupTarget
+
+
+def git(repo, *args: str) -> str:
+    return subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'config', 'user.name', 'Test')
+    git(tmp_path, 'config', 'user.email', 'test@example.com')
+    return tmp_path
+
+
+def commit_files(repo, message: str, files: dict) -> str:
+    """Write the files ({path: text}) and commit them; returns the commit hash."""
+    for name, text in files.items():
+        (repo / name).write_text(text)
+    git(repo, 'add', '-A')
+    git(repo, 'commit', '-q', '-m', message)
+    return git(repo, 'rev-parse', 'HEAD').strip()
+
+
+def numbered(*overrides: str, count: int = 12) -> str:
+    """Lines "line 1".."line N", with overrides given as "N=text" ("N=" drops the line)."""
+    lines = {n: f"line {n}" for n in range(1, count + 1)}
+    for override in overrides:
+        n, text = override.split('=', 1)
+        lines[int(n)] = text
+    return ''.join(f"{text}\n" for _, text in sorted(lines.items()) if text)
+
+
+def target(commit_hash: str, message: str, *lines: ChangedLine) -> FixupTarget:
+    return FixupTarget(commit_hash=commit_hash, commit_message=message, author="Test <test@example.com>",
+                       changed_lines=list(lines), files=tuple(sorted({line.file_path for line in lines})))
+
+
+def create(repo, *targets: FixupTarget):
+    return FixupCreator(str(repo))._create_fixup_chain(list(targets), [])
+
+
+def file_at(repo, rev: str, path: str) -> str:
+    return git(repo, 'show', f"{rev}:{path}")
+
+
+def assert_all_committed(repo, commits):
+    assert git(repo, 'rev-parse', 'HEAD').strip() == commits[-1]
+    assert git(repo, 'status', '--porcelain') == ''
+
+
+def test_interleaved_hunks_of_several_targets_in_one_file(repo):
+    commit_files(repo, "base", {'f.txt': numbered()})
+    first = commit_files(repo, "first", {'f.txt': numbered("2=first 2", "8=first 8")})
+    second = commit_files(repo, "second", {'f.txt': numbered("2=first 2", "5=second 5", "8=first 8", "11=second 11")})
+    fixed = numbered("2=fix 2", "5=fix 5", "8=fix 8", "11=fix 11")
+    (repo / 'f.txt').write_text(fixed)
+
+    commits = create(
+        repo,
+        target(first, "first", ChangedLine('f.txt', 2, 'fix 2', 'modified'), ChangedLine('f.txt', 8, 'fix 8', 'modified')),
+        target(second, "second", ChangedLine('f.txt', 5, 'fix 5', 'modified'), ChangedLine('f.txt', 11, 'fix 11', 'modified')),
+    )
+
+    assert len(commits) == 2
+    assert file_at(repo, commits[0], 'f.txt') == numbered("2=fix 2", "5=second 5", "8=fix 8", "11=second 11")
+    assert file_at(repo, commits[1], 'f.txt') == fixed
+    assert git(repo, 'log', '-2', '--format=%s') == "fixup! second\nfixup! first\n"
+    assert_all_committed(repo, commits)
+
+
+def test_pure_addition_and_deletion(repo):
+    commit_files(repo, "base", {'f.txt': numbered()})
+    early = commit_files(repo, "early", {'f.txt': numbered("3=early 3")})
+    late = commit_files(repo, "late", {'f.txt': numbered("3=early 3", "8=late 8")})
+    # Insert a line after line 3 and drop line 8
+    worktree = numbered("3=early 3\ninserted", "8=")
+    (repo / 'f.txt').write_text(worktree)
+
+    # The first target owns the later hunk, so its patch must not be shifted by the earlier one
+    commits = create(
+        repo,
+        target(late, "late", ChangedLine('f.txt', 8, 'late 8', 'deleted')),
+        target(early, "early", ChangedLine('f.txt', 4, 'inserted', 'added')),
+    )
+
+    assert len(commits) == 2
+    assert file_at(repo, commits[0], 'f.txt') == numbered("3=early 3", "8=")
+    assert file_at(repo, commits[1], 'f.txt') == worktree
+    assert_all_committed(repo, commits)
+
+
+def test_no_newline_at_end_of_file(repo):
+    commit_files(repo, "base", {'f.txt': "a\nb\nc"})
+    top = commit_files(repo, "top", {'f.txt': "a top\nb\nc"})
+    last = commit_files(repo, "last", {'f.txt': "a top\nb\nc last"})
+    (repo / 'f.txt').write_text("a fixed\nb\nc fixed")
+
+    commits = create(
+        repo,
+        target(last, "last", ChangedLine('f.txt', 3, 'c fixed', 'modified')),
+        target(top, "top", ChangedLine('f.txt', 1, 'a fixed', 'modified')),
+    )
+
+    assert file_at(repo, commits[0], 'f.txt') == "a top\nb\nc fixed"
+    assert file_at(repo, commits[1], 'f.txt') == "a fixed\nb\nc fixed"
+    assert_all_committed(repo, commits)
+
+
+# Git appends a tab to header paths with a space and C-quotes non-ASCII ones
+@pytest.mark.parametrize('name', ['sp ace.txt', 'tést.txt'])
+def test_unusual_path_names(repo, name):
+    both = commit_files(repo, "both", {'plain.txt': "one\ntwo\n", name: "one\ntwo\n"})
+    (repo / 'plain.txt').write_text("one\nTWO\n")
+    (repo / name).write_text("one\nTWO\n")
+
+    commits = create(repo, target(both, "both",
+                                  ChangedLine('plain.txt', 2, 'TWO', 'modified'),
+                                  ChangedLine(name, 2, 'TWO', 'modified')))
+
+    assert file_at(repo, commits[0], 'plain.txt') == "one\nTWO\n"
+    assert file_at(repo, commits[0], name) == "one\nTWO\n"
+    assert_all_committed(repo, commits)
+
+
+@pytest.mark.parametrize('config', ['diff.mnemonicPrefix', 'diff.noprefix'])
+def test_diff_prefix_config_is_ignored(repo, config):
+    commit_files(repo, "base", {'f.txt': "one\n"})
+    git(repo, 'config', config, 'true')
+    (repo / 'f.txt').write_text("two\n")
+
+    file_diffs = FixupCreator(str(repo))._read_worktree_hunks()
+
+    assert list(file_diffs) == ['f.txt']
+    assert file_diffs['f.txt'].header[1:] == ['--- a/f.txt', '+++ b/f.txt']
+
+
+def test_rebase_parent_is_below_the_oldest_of_several_targets(repo):
+    base = commit_files(repo, "base", {'f.txt': "0\n"})
+    oldest, middle, newest = (commit_files(repo, str(n), {'f.txt': f"{n}\n"}) for n in (1, 2, 3))
+
+    parent = FixupCreator(str(repo))._find_rebase_parent([newest, oldest, middle])
+
+    assert parent == base
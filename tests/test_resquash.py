@@ -0,0 +1,90 @@
+"""Tests for converting a fixup! commit into a squash! commit."""
+
+import subprocess
+
+import pytest
+
+from fastfixupfinder import fixup_creator
+from fastfixupfinder.fixup_creator import FixupCreator
+
+
+def git(repo, *args: str) -> str:
+    return subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+
+def commit_file(repo, message: str, text: str) -> str:
+    (repo / 'f.txt').write_text(text)
+    git(repo, 'add', '-A')
+    git(repo, 'commit', '-q', '-m', message)
+    return git(repo, 'rev-parse', 'HEAD').strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'config', 'user.name', 'Test')
+    git(tmp_path, 'config', 'user.email', 'test@example.com')
+    commit_file(tmp_path, "target", "one\n")
+    # Accept the prefilled message and confirm without a terminal
+    monkeypatch.setattr(FixupCreator, '_edit_commit_message_in_editor', lambda self, message: message)
+    monkeypatch.setattr(fixup_creator, '_read_line', lambda prompt: 'y')
+    return tmp_path
+
+
+def subjects(repo) -> list:
+    return git(repo, 'log', '--format=%s').splitlines()
+
+
+def test_resquash_head_moves_branch(repo):
+    fixup = commit_file(repo, "fixup! target", "two\n")
+
+    assert FixupCreator(str(repo)).resquash_commit(fixup)
+
+    assert subjects(repo) == ["squash! target", "target"]
+    assert git(repo, 'symbolic-ref', '--short', 'HEAD').strip() in ('master', 'main')
+    assert git(repo, 'rev-parse', 'HEAD^{tree}') == git(repo, 'rev-parse', f"{fixup}^{{tree}}")
+
+
+def test_resquash_replays_later_commits(repo):
+    fixup = commit_file(repo, "fixup! target", "two\n")
+    commit_file(repo, "later", "three\n")
+
+    assert FixupCreator(str(repo)).resquash_commit(fixup)
+
+    assert subjects(repo) == ["later", "squash! target", "target"]
+    assert (repo / 'f.txt').read_text() == "three\n"
+
+
+def test_resquash_refuses_dirty_tree(repo, capsys):
+    fixup = commit_file(repo, "fixup! target", "two\n")
+    commit_file(repo, "later", "three\n")
+    (repo / 'f.txt').write_text("uncommitted\n")
+    objects_before = git(repo, 'count-objects')
+
+    assert not FixupCreator(str(repo)).resquash_commit(fixup)
+
+    assert "commit or stash" in capsys.readouterr().out
+    assert subjects(repo) == ["later", "fixup! target", "target"]
+    assert git(repo, 'count-objects') == objects_before
+    assert (repo / 'f.txt').read_text() == "uncommitted\n"
+
+
+def test_resquash_keeps_author_and_date(repo):
+    commit_file(repo, "fixup! target", "two\n")
+    git(repo, 'commit', '-q', '--amend', '--no-edit', '--author=Other <other@example.com>',
+        '--date=2001-02-03T04:05:06+01:00')
+
+    assert FixupCreator(str(repo)).resquash_commit(git(repo, 'rev-parse', 'HEAD').strip())
+
+    assert git(repo, 'log', '-1', '--format=%an <%ae> %aI') == "Other <other@example.com> 2001-02-03T04:05:06+01:00\n"
+
+
+def test_resquash_signs_when_configured(repo):
+    fixup = commit_file(repo, "fixup! target", "two\n")
+    # A signing program that always fails shows whether signing was attempted
+    git(repo, 'config', 'commit.gpgSign', 'true')
+    git(repo, 'config', 'gpg.program', 'false')
+
+    assert not FixupCreator(str(repo)).resquash_commit(fixup)
+
+    assert subjects(repo) == ["fixup! target", "target"]
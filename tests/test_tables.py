@@ -0,0 +1,79 @@
+"""Tests for the plain-text tables, pinned to the tabulate output they replace.
+
+The expected strings are what tabulate 0.10 (with wcwidth) renders for the
+same data, using the options the CLI used to pass: tablefmt="simple" with
+stralign="left", and tablefmt="fancy_grid" with stralign="left" and
+disable_numparse=True.
+"""
+
+from fastfixupfinder.tables import format_grid_table, format_simple_table, visible_len
+
+
+def cyan(text: str) -> str:
+    return f"\x1b[36m{text}\x1b[0m"
+
+
+def test_visible_len():
+    assert visible_len("plain") == 5
+    assert visible_len(cyan("12")) == 2
+    assert visible_len("日本語") == 6
+    assert visible_len("🎉") == 2
+    assert visible_len("é") == 1  # Combining accent takes no space
+    assert visible_len("") == 0
+
+
+def test_simple_table_matches_tabulate():
+    # Colored numeric columns are right-aligned, as tabulate's number detection did
+    headers = ("Hash", "Commit Message", cyan("Files"), cyan("Lines"))
+    rows = [
+        (cyan("1a2b3c4d"), "Fix typo in parser", cyan("3"), cyan("12")),
+        (cyan("deadbeef"), "日本語 message 🎉", cyan("10"), cyan("7")),
+    ]
+
+    table = format_simple_table(rows, headers, (False, False, True, True))
+
+    assert table == "\n".join([
+        f"Hash      Commit Message        {cyan('Files')}    {cyan('Lines')}",
+        "--------  ------------------  -------  -------",
+        f"{cyan('1a2b3c4d')}  Fix typo in parser        {cyan('3')}       {cyan('12')}",
+        f"{cyan('deadbeef')}  日本語 message 🎉        {cyan('10')}        {cyan('7')}",
+    ])
+
+
+def test_grid_table_matches_tabulate():
+    headers = ("Commit", "Message", "Diff")
+    rows = [
+        ("1a2b3c4d", "Fix typo", "x.py\n  ~ 12: foo\n  + 13: 日本"),
+        ("deadbeef", cyan("colored"), ""),
+    ]
+
+    table = format_grid_table(rows, headers)
+
+    assert table == "\n".join([
+        "╒══════════╤═══════════╤══════════════╕",
+        "│ Commit   │ Message   │ Diff         │",
+        "╞══════════╪═══════════╪══════════════╡",
+        "│ 1a2b3c4d │ Fix typo  │ x.py         │",
+        "│          │           │   ~ 12: foo  │",
+        "│          │           │   + 13: 日本 │",
+        "├──────────┼───────────┼──────────────┤",
+        f"│ deadbeef │ {cyan('colored')}   │              │",
+        "╘══════════╧═══════════╧══════════════╛",
+    ])
+
+
+def test_grid_table_with_single_line_cells_matches_tabulate():
+    # Without multi-line cells, a row whose cells are empty still takes up a line
+    table = format_grid_table([("a", "", ""), ("", "", ""), ("b", "c", "")], ("Commit", "Message", "Diff"))
+
+    assert table == "\n".join([
+        "╒══════════╤═══════════╤════════╕",
+        "│ Commit   │ Message   │ Diff   │",
+        "╞══════════╪═══════════╪════════╡",
+        "│ a        │           │        │",
+        "├──────────┼───────────┼────────┤",
+        "│          │           │        │",
+        "├──────────┼───────────┼────────┤",
+        "│ b        │ c         │        │",
+        "╘══════════╧═══════════╧════════╛",
+    ])